@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 """Visual verification report for scheduling-primitives.
 
-Run:  uv run python scripts/verify.py
+Run:  uv run python scripts/verify.py [--no-art]
+
+  --no-art  skip the ASCII calendar/bitmap renderings (tables only)
 
 Produces a formatted report showing:
   1. Reference data (epoch, day/offset table, time/minute table)
@@ -12,9 +14,14 @@ Produces a formatted report showing:
 
 from __future__ import annotations
 
+import argparse
+import io
 import json
 import sys
+from contextlib import redirect_stdout
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -33,17 +40,56 @@ from scheduling_primitives.occupancy import OccupancyBitmap, allocate, walk
 from scheduling_primitives.resolution import MINUTE
 from scheduling_primitives.types import InfeasibleError
 
+try:
+    # Optional: faster parsing when available, not a project dependency
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 
 def _load(path: Path):
-    with open(path) as f:
-        return json.load(f)
+    return _loads(path.read_bytes())
 
 
 _ref = _load(FIXTURES / "reference.json")
 _cals = _load(FIXTURES / "calendars.json")
 
+# Every scenario file is parsed once here, keyed by stem, rather than on
+# every section call
+_scenarios = {p.stem: _load(p) for p in sorted(SCENARIOS.glob("*.json"))}
+
 EPOCH = datetime.fromisoformat(_ref["epoch"])
 DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# ---------------------------------------------------------------------------
+# Output buffering
+# ---------------------------------------------------------------------------
+_OUT: list[str] = []
+_SHOW_ART = True
+
+
+def emit(s: str = "") -> None:
+    """Queue one line of report output. Written out by flush()."""
+    _OUT.append(s + "\n")
+
+
+def flush() -> None:
+    """Write all queued output to stdout in one call."""
+    sys.stdout.write("".join(_OUT))
+    sys.stdout.flush()
+    _OUT.clear()
+
+
+def _show(fn, *args) -> None:
+    """Run a debug show_* function, queueing its output instead of printing."""
+    if not _SHOW_ART:
+        return
+    with redirect_stdout(io.StringIO()):
+        text = fn(*args)
+    emit(text)
+
 
 # ---------------------------------------------------------------------------
 # Formatting helpers
@@ -52,55 +98,81 @@ WIDTH = 90
 
 
 def banner(title: str):
-    print()
-    print("=" * WIDTH)
-    print(f"  {title}")
-    print("=" * WIDTH)
+    emit()
+    emit("=" * WIDTH)
+    emit(f"  {title}")
+    emit("=" * WIDTH)
 
 
 def heading(title: str):
-    print()
-    print(f"  {title}")
-    print(f"  {'-' * (len(title) + 2)}")
+    emit()
+    emit(f"  {title}")
+    emit(f"  {'-' * (len(title) + 2)}")
 
 
 def table(headers: list[str], rows: list[list[str]], indent: int = 4):
     """Print a formatted table with auto-sized columns."""
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(cell))
+    col_widths = [
+        max(len(h), *(len(r[i]) for r in rows if i < len(r)), 0)
+        for i, h in enumerate(headers)
+    ]
 
     pad = " " * indent
-    fmt = pad + "  ".join(f"{{:<{w}}}" for w in col_widths)
-    sep = pad + "  ".join("-" * w for w in col_widths)
 
-    print(fmt.format(*headers))
-    print(sep)
-    for row in rows:
-        # Pad short rows
-        padded = row + [""] * (len(headers) - len(row))
-        print(fmt.format(*padded))
+    def fmt(cells: list[str]) -> str:
+        # zip_longest pads short rows with "" without building a padded copy
+        return pad + "  ".join(
+            c.ljust(w) for c, w in zip_longest(cells, col_widths, fillvalue="")
+        )
+
+    lines = [fmt(headers), pad + "  ".join("-" * w for w in col_widths)]
+    lines.extend(fmt(row) for row in rows)
+    emit("\n".join(lines))
+
+
+@lru_cache(maxsize=None)
+def _iso(s: str) -> datetime:
+    """Parse an ISO datetime string. Fixture timestamps repeat heavily."""
+    return datetime.fromisoformat(s)
 
 
+@lru_cache(maxsize=None)
 def _fmt_dt(iso: str) -> str:
-    """Format ISO datetime as 'Mon 06 Jan 09:00'."""
-    dt = datetime.fromisoformat(iso)
-    day_name = DAY_NAMES[dt.weekday()]
-    return f"{day_name} {dt.strftime('%d %b %H:%M')}"
+    """Format ISO datetime as 'Mon 06 Jan 09:00'.
 
+    Fixture datetimes are always 'YYYY-MM-DDTHH:MM[:SS]', so fields are
+    sliced out directly instead of going through fromisoformat/strftime.
+    """
+    y, m, d = int(iso[0:4]), int(iso[5:7]), int(iso[8:10])
+    day_name = DAY_NAMES[date(y, m, d).weekday()]
+    return f"{day_name} {iso[8:10]} {MONTH_NAMES[m - 1]} {iso[11:16]}"
 
+
+@lru_cache(maxsize=None)
 def _make_cal(name: str) -> WorkingCalendar:
+    """Build a calendar by name. Calendars are immutable, so one per name."""
     config = _cals[name]
     rules = {int(k): v for k, v in config["rules"].items()}
     exceptions = config.get("exceptions", {})
     return WorkingCalendar(name, rules, exceptions)
 
 
-def _make_bm(name: str = "standard", horizon_end: str | None = None):
-    cal = _make_cal(name)
-    h_end = datetime.fromisoformat(horizon_end) if horizon_end else datetime(2025, 1, 13)
-    return OccupancyBitmap.from_calendar(cal, EPOCH, h_end, EPOCH, MINUTE)
+# Materialised bitmaps keyed by (calendar name, horizon_start, horizon_end)
+_bm_templates: dict[tuple[str, str | None, str | None], OccupancyBitmap] = {}
+
+
+def _make_bm(name: str = "standard", horizon_end: str | None = None,
+             horizon_start: str | None = None):
+    """Fresh bitmap for a calendar. Materialised once, copied per call."""
+    key = (name, horizon_start, horizon_end)
+    template = _bm_templates.get(key)
+    if template is None:
+        cal = _make_cal(name)
+        h_start = _iso(horizon_start) if horizon_start else EPOCH
+        h_end = _iso(horizon_end) if horizon_end else datetime(2025, 1, 13)
+        template = OccupancyBitmap.from_calendar(cal, h_start, h_end, EPOCH, MINUTE)
+        _bm_templates[key] = template
+    return template.copy()
 
 
 # ---------------------------------------------------------------------------
@@ -108,14 +180,14 @@ def _make_bm(name: str = "standard", horizon_end: str | None = None):
 # ---------------------------------------------------------------------------
 def section_reference():
     banner("REFERENCE DATA")
-    print(f"\n    Epoch:          {EPOCH.strftime('%A %Y-%m-%d %H:%M')}")
-    print(f"    Minutes/day:    {_ref['minutes_per_day']}")
-    print(f"    Work day:       {_ref['work_day_minutes']} min (08:00-17:00)")
+    emit(f"\n    Epoch:          {EPOCH.strftime('%A %Y-%m-%d %H:%M')}")
+    emit(f"    Minutes/day:    {_ref['minutes_per_day']}")
+    emit(f"    Work day:       {_ref['work_day_minutes']} min (08:00-17:00)")
 
     heading("Day / Offset Mapping")
     rows = []
     for d in _ref["days"]:
-        dt = datetime.fromisoformat(d["date"] + "T00:00:00")
+        dt = _iso(d["date"] + "T00:00:00")
         day_name = DAY_NAMES[dt.weekday()] if d["name"] != "next_mon" else "Mon"
         rows.append([d["name"], d["date"], day_name, str(d["day_offset"])])
     table(["Name", "Date", "Day", "Offset (min)"], rows)
@@ -127,9 +199,9 @@ def section_reference():
     table(["Time", "Minutes"], rows)
 
     heading("Quick Offset Formula")
-    print("    offset(day, time) = day_offset + time_minutes")
-    print("    Example: Tue 08:00 = 1440 + 480 = 1920")
-    print("    Example: Fri 16:30 = 5760 + 990 = 6750")
+    emit("    offset(day, time) = day_offset + time_minutes")
+    emit("    Example: Tue 08:00 = 1440 + 480 = 1920")
+    emit("    Example: Fri 16:30 = 5760 + 990 = 6750")
 
 
 # ---------------------------------------------------------------------------
@@ -140,10 +212,10 @@ def section_calendars():
 
     for cal_name, config in _cals.items():
         heading(f"Calendar: {cal_name}")
-        print(f"    {config['description']}")
+        emit(f"    {config['description']}")
 
         # Rules table
-        print()
+        emit()
         rows = []
         for wd in range(7):
             day_label = DAY_NAMES[wd]
@@ -159,10 +231,10 @@ def section_calendars():
         # Exceptions table
         exc = config.get("exceptions", {})
         if exc:
-            print()
+            emit()
             rows = []
             for exc_date, entries in exc.items():
-                dt = datetime.fromisoformat(exc_date + "T00:00:00")
+                dt = _iso(exc_date + "T00:00:00")
                 day_label = DAY_NAMES[dt.weekday()]
                 for entry in entries:
                     if not entry.get("is_working", True):
@@ -174,12 +246,12 @@ def section_calendars():
                         ])
             table(["Date", "Day", "Type", "Hours"], rows)
         else:
-            print("    Exceptions: (none)")
+            emit("    Exceptions: (none)")
 
         # ASCII week view
         cal = _make_cal(cal_name)
-        print()
-        show_calendar(cal, date(2025, 1, 6), date(2025, 1, 13))
+        emit()
+        _show(show_calendar, cal, date(2025, 1, 6), date(2025, 1, 13))
 
 
 # ---------------------------------------------------------------------------
@@ -188,17 +260,17 @@ def section_calendars():
 def section_calendar_arithmetic():
     banner("LAYER 1: CALENDAR ARITHMETIC")
 
-    data = _load(SCENARIOS / "calendar_arithmetic.json")
+    data = _scenarios["calendar_arithmetic"]
 
     # --- add_minutes ---
     heading("Function: cal.add_minutes(start, minutes) -> datetime")
-    print("    Walks forward through working time, skipping non-working gaps.\n")
+    emit("    Walks forward through working time, skipping non-working gaps.\n")
     rows = []
     for s in data["add_minutes"]:
         cal = _make_cal(s["calendar"])
-        start = datetime.fromisoformat(s["start"])
+        start = _iso(s["start"])
         result = cal.add_minutes(start, s["minutes"])
-        expected = datetime.fromisoformat(s["expected"])
+        expected = _iso(s["expected"])
         match = "OK" if result == expected else "FAIL"
         rows.append([
             s["id"], s["calendar"],
@@ -209,13 +281,13 @@ def section_calendar_arithmetic():
 
     # --- subtract_minutes ---
     heading("Function: cal.subtract_minutes(end, minutes) -> datetime")
-    print("    Walks backward through working time.\n")
+    emit("    Walks backward through working time.\n")
     rows = []
     for s in data["subtract_minutes"]:
         cal = _make_cal(s["calendar"])
-        start = datetime.fromisoformat(s["start"])
+        start = _iso(s["start"])
         result = cal.subtract_minutes(start, s["minutes"])
-        expected = datetime.fromisoformat(s["expected"])
+        expected = _iso(s["expected"])
         match = "OK" if result == expected else "FAIL"
         rows.append([
             s["id"], s["calendar"],
@@ -226,12 +298,12 @@ def section_calendar_arithmetic():
 
     # --- working_minutes_between ---
     heading("Function: cal.working_minutes_between(start, end) -> int")
-    print("    Counts working minutes in [start, end).\n")
+    emit("    Counts working minutes in [start, end).\n")
     rows = []
     for s in data["working_minutes_between"]:
         cal = _make_cal(s["calendar"])
-        start = datetime.fromisoformat(s["start"])
-        end = datetime.fromisoformat(s["end"])
+        start = _iso(s["start"])
+        end = _iso(s["end"])
         result = cal.working_minutes_between(start, end)
         match = "OK" if result == s["expected"] else "FAIL"
         rows.append([
@@ -243,14 +315,13 @@ def section_calendar_arithmetic():
 
     # --- working_intervals_in_range ---
     heading("Function: cal.working_intervals_in_range(start, end) -> [(dt, dt), ...]")
-    print("    Enumerates working intervals within a date range.\n")
+    emit("    Enumerates working intervals within a date range.\n")
     rows = []
     for s in data["working_intervals_in_range"]:
         cal = _make_cal(s["calendar"])
-        start = datetime.fromisoformat(s["start"])
-        end = datetime.fromisoformat(s["end"])
-        intervals = list(cal.working_intervals_in_range(start, end))
-        count = len(intervals)
+        start = _iso(s["start"])
+        end = _iso(s["end"])
+        count = sum(1 for _ in cal.working_intervals_in_range(start, end))
         expected_count = len(s["expected"])
         match = "OK" if count == expected_count else "FAIL"
         if count > 0:
@@ -268,11 +339,11 @@ def section_calendar_arithmetic():
 
     # --- round_trips ---
     heading("Function: add(subtract(dt, n), n) == dt (round-trip identity)")
-    print("    Verifies forward and backward walks are exact inverses.\n")
+    emit("    Verifies forward and backward walks are exact inverses.\n")
     rows = []
     for s in data["round_trips"]:
         cal = _make_cal(s["calendar"])
-        dt = datetime.fromisoformat(s["datetime"])
+        dt = _iso(s["datetime"])
         n = s["minutes"]
         if s.get("direction") == "reverse":
             result = cal.subtract_minutes(cal.add_minutes(dt, n), n)
@@ -296,16 +367,17 @@ def section_bitmap():
 
     # --- from_calendar ---
     heading("Function: OccupancyBitmap.from_calendar(cal, start, end, epoch, res)")
-    print("    Materialises calendar into integer capacity state.\n")
-    occ = _load(SCENARIOS / "occupancy.json")
+    emit("    Materialises calendar into integer capacity state.\n")
+    occ = _scenarios["occupancy"]
     for s in occ["bitmap_construction"]:
         bm = _make_bm(s["calendar"],
                        horizon_end=s["horizon_end"])
+        free = bm.bits.count(1)  # C-level scan of the bytearray, one pass
         rows = [
             ["Total bits", str(len(bm.bits)), str(s["expected_total_bits"]),
              "OK" if len(bm.bits) == s["expected_total_bits"] else "FAIL"],
-            ["Free bits", str(sum(bm.bits)), str(s["expected_free_bits"]),
-             "OK" if sum(bm.bits) == s["expected_free_bits"] else "FAIL"],
+            ["Free bits", str(free), str(s["expected_free_bits"]),
+             "OK" if free == s["expected_free_bits"] else "FAIL"],
             ["horizon_begin", str(bm.horizon_begin), str(s["expected_horizon_begin"]),
              "OK" if bm.horizon_begin == s["expected_horizon_begin"] else "FAIL"],
             ["horizon_end", str(bm.horizon_end), str(s["expected_horizon_end"]),
@@ -314,12 +386,18 @@ def section_bitmap():
         table(["Property", "Actual", "Expected", ""], rows)
 
     heading("Bit Range Verification")
-    print("    Checks specific offset ranges have correct values (0=non-working, 1=free).\n")
+    emit("    Checks specific offset ranges have correct values (0=non-working, 1=free).\n")
     rows = []
+    # Range checks only read bits, so one bitmap per calendar serves every row
+    bms = {
+        name: _make_bm(name)
+        for name in {s.get("calendar", "standard") for s in occ["bit_ranges"]}
+    }
     for s in occ["bit_ranges"]:
-        bm = _make_bm(s.get("calendar", "standard"))
-        ok = all(bm.bits[i] == s["expected_value"]
-                 for i in range(s["range_start"], s["range_end"]))
+        bm = bms[s.get("calendar", "standard")]
+        lo, hi = s["range_start"], s["range_end"]
+        # Whole-range compare is a single memcmp on the bytearray
+        ok = bm.bits[lo:hi] == bytes([s["expected_value"]]) * (hi - lo)
         rows.append([
             s["id"],
             f"{s['range_start']}-{s['range_end']}",
@@ -332,21 +410,36 @@ def section_bitmap():
     # ASCII view of standard bitmap
     heading("Standard Bitmap  -- Visual (. = non-working, - = free)")
     bm = _make_bm("standard")
-    print()
-    show_bitmap(bm, MINUTE, EPOCH)
+    emit()
+    _show(show_bitmap, bm, MINUTE, EPOCH)
 
 
 def section_walk():
     banner("LAYER 2: WALK (read-only slot finding)")
 
-    data = _load(SCENARIOS / "walk.json")
+    data = _scenarios["walk"]
+
+    # walk() never changes occupancy (auto-extension only appends bits derived
+    # from the calendar), so every row on a calendar and horizon can share one
+    # bitmap
+    def bm_key(s: dict) -> tuple[str, str | None, str | None]:
+        return s["calendar"], s.get("horizon_end"), s.get("horizon_start")
+
+    bms = {
+        key: _make_bm(*key)
+        for key in {
+            bm_key(s)
+            for group in ("non_splittable", "non_splittable_deadline", "splittable")
+            for s in data[group]
+        }
+    }
 
     # --- non-splittable ---
     heading("Function: walk(bm, op_id, earliest_start, work_units) -> AllocationRecord")
-    print("    Finds earliest contiguous free run. Does NOT mutate bitmap.\n")
+    emit("    Finds earliest contiguous free run. Does NOT mutate bitmap.\n")
     rows = []
     for s in data["non_splittable"]:
-        bm = _make_bm(s["calendar"])
+        bm = bms[bm_key(s)]
         r = walk(bm, s["operation_id"],
                  earliest_start=s["earliest_start"],
                  work_units=s["work_units"])
@@ -365,7 +458,7 @@ def section_walk():
     heading("walk() with deadline  -- InfeasibleError expected")
     rows = []
     for s in data["non_splittable_deadline"]:
-        bm = _make_bm(s["calendar"])
+        bm = bms[bm_key(s)]
         try:
             walk(bm, s["operation_id"],
                  earliest_start=s["earliest_start"],
@@ -388,7 +481,7 @@ def section_walk():
     heading("walk() with allow_split=True  -- greedy consumption across gaps")
     rows = []
     for s in data["splittable"]:
-        bm = _make_bm(s["calendar"])
+        bm = bms[bm_key(s)]
         r = walk(bm, s["operation_id"],
                  earliest_start=s["earliest_start"],
                  work_units=s["work_units"],
@@ -408,19 +501,19 @@ def section_walk():
 def section_allocate():
     banner("LAYER 2: ALLOCATE + DEALLOCATE")
 
-    data = _load(SCENARIOS / "allocate.json")
+    data = _scenarios["allocate"]
 
     heading("Function: allocate(bm, op_id, start, units) -> AllocationRecord")
-    print("    walk + commit: finds slot then marks bits as occupied.\n")
+    emit("    walk + commit: finds slot then marks bits as occupied.\n")
 
     # Sequential allocation demo with bitmap viz
     heading("Sequential Allocation Demo")
-    print("    Three jobs allocated on standard calendar, bitmap before and after.\n")
+    emit("    Three jobs allocated on standard calendar, bitmap before and after.\n")
 
     bm = _make_bm("standard")
-    print("    BEFORE (all working time free):")
-    print()
-    show_bitmap(bm, MINUTE, EPOCH)
+    emit("    BEFORE (all working time free):")
+    emit()
+    _show(show_bitmap, bm, MINUTE, EPOCH)
 
     r1 = allocate(bm, "JOB-A", earliest_start=480, work_units=300)
     r2 = allocate(bm, "JOB-B", earliest_start=480, work_units=480)
@@ -437,41 +530,41 @@ def section_allocate():
          str(r3.start), str(r3.finish),
          " + ".join(f"[{a},{b})" for a, b in r3.spans)],
     ]
-    print()
+    emit()
     table(["Job", "From", "Units", "Split?", "Start", "Finish", "Spans"], rows)
 
-    print("\n    AFTER:")
-    print()
-    show_bitmap(bm, MINUTE, EPOCH)
+    emit("\n    AFTER:")
+    emit()
+    _show(show_bitmap, bm, MINUTE, EPOCH)
 
     # Deallocate demo
     heading("Deallocate Demo")
-    print("    Removing JOB-B, then showing bitmap.\n")
+    emit("    Removing JOB-B, then showing bitmap.\n")
 
     from scheduling_primitives.occupancy import deallocate
     deallocate(bm, r2)
 
-    print("    AFTER removing JOB-B:")
-    print()
-    show_bitmap(bm, MINUTE, EPOCH)
+    emit("    AFTER removing JOB-B:")
+    emit()
+    _show(show_bitmap, bm, MINUTE, EPOCH)
 
 
 def section_auto_extend():
     banner("LAYER 2: AUTO-EXTENSION")
 
-    data = _load(SCENARIOS / "auto_extend.json")
+    data = _scenarios["auto_extend"]
 
     heading("Bitmap auto-extends when work exceeds horizon")
-    print("    Initial bitmap covers Mon-Tue only (2880 bits).")
-    print("    Allocations that exceed capacity trigger extension.\n")
+    emit("    Initial bitmap covers Mon-Tue only (2880 bits).")
+    emit("    Allocations that exceed capacity trigger extension.\n")
 
     spec = next(s for s in data["auto_extend"] if s["id"] == "allocate_three_days")
     bm = _make_bm(spec["calendar"], horizon_end=spec["horizon_end"])
     initial = len(bm.bits)
 
-    print(f"    Initial bitmap size: {initial} bits")
-    print(f"    Mon working: 540 min, Tue working: 540 min, Total: 1080 min")
-    print()
+    emit(f"    Initial bitmap size: {initial} bits")
+    emit(f"    Mon working: 540 min, Tue working: 540 min, Total: 1080 min")
+    emit()
 
     rows = []
     for step in spec["sequence"]:
@@ -487,30 +580,53 @@ def section_auto_extend():
         ])
     table(["Job", "Units", "Start", "Finish", "Bitmap Size", "Extended?"], rows)
 
-    print(f"\n    Final bitmap size: {len(bm.bits)} bits "
+    emit(f"\n    Final bitmap size: {len(bm.bits)} bits "
           f"(grew from {initial})")
-    print()
-    show_bitmap(bm, MINUTE, EPOCH)
+    emit()
+    _show(show_bitmap, bm, MINUTE, EPOCH)
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
-def main():
-    banner("SCHEDULING-PRIMITIVES   --  VISUAL VERIFICATION REPORT")
-    print(f"    Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    print(f"    Fixture data: {FIXTURES.relative_to(ROOT)}/")
+def main(argv: list[str] | None = None):
+    global _SHOW_ART
 
-    section_reference()
-    section_calendars()
-    section_calendar_arithmetic()
-    section_bitmap()
-    section_walk()
-    section_allocate()
-    section_auto_extend()
+    parser = argparse.ArgumentParser(description="Visual verification report.")
+    parser.add_argument(
+        "--no-art", action="store_true",
+        help="skip ASCII calendar/bitmap renderings",
+    )
+    args = parser.parse_args(argv)
+    _SHOW_ART = not args.no_art
+
+    # Interactive runs flush per section so progress is visible; when piped
+    # (CI logs, files) the whole report is written in a single call at the end
+    interactive = sys.stdout.isatty()
+
+    banner("SCHEDULING-PRIMITIVES   --  VISUAL VERIFICATION REPORT")
+    emit(f"    Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    emit(f"    Fixture data: {FIXTURES.relative_to(ROOT)}/")
+
+    if interactive:
+        flush()
+
+    for section in (
+        section_reference,
+        section_calendars,
+        section_calendar_arithmetic,
+        section_bitmap,
+        section_walk,
+        section_allocate,
+        section_auto_extend,
+    ):
+        section()
+        if interactive:
+            flush()
 
     banner("END OF REPORT")
-    print()
+    emit()
+    flush()
 
 
 if __name__ == "__main__":
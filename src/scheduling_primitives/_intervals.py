@@ -0,0 +1,440 @@
+"""Layer 2: IntervalOccupancy — sparse interval-list capacity tracking.
+
+The interval list engine from specs/architecture.md §4.2. Free time is a
+sorted list of non-overlapping, non-adjacent half-open (begin, end) pairs, so
+storage and scan cost scale with the number of working periods rather than
+with horizon length x resolution.
+
+Provides the same walk / allocate / deallocate / apply_dynamic_exception
+operations as the bitmap engine in occupancy.py, with identical results.
+Private for now: not exported from the package until the spec covers it.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from scheduling_primitives._records import forget, overlaps
+from scheduling_primitives.resolution import MINUTE
+from scheduling_primitives.types import AllocationRecord, InfeasibleError
+
+if TYPE_CHECKING:
+    from scheduling_primitives.calendar import WorkingCalendar
+    from scheduling_primitives.resolution import TimeResolution
+
+
+# Default extension: 7 days of units (matches the bitmap engine)
+_DEFAULT_EXTEND_DAYS = 7
+
+_BEGIN = itemgetter(0)
+_END = itemgetter(1)
+
+
+@dataclass
+class IntervalOccupancy:
+    """Mutable capacity state for one resource. Auto-extends on demand.
+
+    free = sorted, merged [begin, end) pairs of free working time within
+    [horizon_begin, horizon_end). Everything else is occupied or non-working.
+    """
+
+    resource_id: str
+    horizon_begin: int
+    horizon_end: int
+    free: list[tuple[int, int]]
+    _calendar: WorkingCalendar
+    _resolution: TimeResolution
+    _epoch: datetime
+    _allocations: list[AllocationRecord] = field(default_factory=list)
+    # Resolution-specific extension sizes, fixed at construction
+    _units_per_day: int = field(init=False, repr=False)
+    _extend_units: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._units_per_day = 24 * 60 * 60 // self._resolution.unit_seconds
+        self._extend_units = _DEFAULT_EXTEND_DAYS * self._units_per_day
+
+    @classmethod
+    def from_calendar(
+        cls,
+        cal: WorkingCalendar,
+        horizon_start: datetime,
+        horizon_end: datetime,
+        epoch: datetime,
+        resolution: TimeResolution | None = None,
+    ) -> IntervalOccupancy:
+        """Materialise calendar into capacity state. The datetime boundary.
+
+        FR-010: Materialise a working calendar into a capacity representation.
+        """
+        if resolution is None:
+            resolution = MINUTE
+
+        begin_int = resolution.to_int(horizon_start, epoch)
+        end_int = resolution.to_int(horizon_end, epoch)
+
+        return cls(
+            resource_id=cal.pattern_id,
+            horizon_begin=begin_int,
+            horizon_end=end_int,
+            free=_intervals_from_calendar(begin_int, end_int, cal, resolution, epoch),
+            _calendar=cal,
+            _resolution=resolution,
+            _epoch=epoch,
+        )
+
+    def _free_count(self) -> int:
+        """Total free units in the current state."""
+        return sum(end - begin for begin, end in self.free)
+
+    def _extend_to(self, needed_end: int) -> None:
+        """Auto-extend the horizon to cover at least `needed_end`.
+
+        Materialises additional calendar time in chunks.
+        """
+        if needed_end <= self.horizon_end:
+            return
+
+        # Extend in chunks of at least 7 days
+        new_end = max(needed_end, self.horizon_end + self._extend_units)
+
+        old_end = self.horizon_end
+        new_free = _intervals_from_calendar(
+            old_end, new_end, self._calendar, self._resolution, self._epoch
+        )
+        if new_free and self.free and self.free[-1][1] == new_free[0][0]:
+            # A period running across the old horizon end stays one interval
+            new_free[0] = (self.free.pop()[0], new_free[0][1])
+        self.free.extend(new_free)
+        self.horizon_end = new_end
+
+    def copy(self) -> IntervalOccupancy:
+        """Deep copy for branching."""
+        return IntervalOccupancy(
+            resource_id=self.resource_id,
+            horizon_begin=self.horizon_begin,
+            horizon_end=self.horizon_end,
+            free=list(self.free),
+            _calendar=self._calendar,
+            _resolution=self._resolution,
+            _epoch=self._epoch,
+            _allocations=list(self._allocations),
+        )
+
+    def checkpoint(
+        self,
+    ) -> tuple[int, tuple[tuple[int, int], ...], tuple[AllocationRecord, ...]]:
+        """Immutable snapshot for backtracking."""
+        return (self.horizon_end, tuple(self.free), tuple(self._allocations))
+
+    def restore(
+        self,
+        snap: tuple[int, tuple[tuple[int, int], ...], tuple[AllocationRecord, ...]],
+    ) -> None:
+        """Restore to snapshot. Mutates in place."""
+        horizon_end, free, allocations = snap
+        self.horizon_end = horizon_end
+        self.free[:] = free
+        self._allocations = list(allocations)
+
+
+def _intervals_from_calendar(
+    begin: int,
+    end: int,
+    cal: WorkingCalendar,
+    resolution: TimeResolution,
+    epoch: datetime,
+) -> list[tuple[int, int]]:
+    """Sorted, merged integer working intervals of the calendar in [begin, end)."""
+    dt_start = resolution.to_datetime(begin, epoch)
+    dt_end = resolution.to_datetime(end, epoch)
+
+    raw = []
+    for iv_start, iv_end in cal.working_intervals_in_range(dt_start, dt_end):
+        lo = max(begin, resolution.to_int(iv_start, epoch))
+        hi = min(end, resolution.to_int(iv_end, epoch))
+        if lo < hi:
+            raw.append((lo, hi))
+    raw.sort()
+
+    # Overlapping exceptions and periods meeting at midnight become one run
+    merged: list[tuple[int, int]] = []
+    for lo, hi in raw:
+        if merged and lo <= merged[-1][1]:
+            if hi > merged[-1][1]:
+                merged[-1] = (merged[-1][0], hi)
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def _add_range(free: list[tuple[int, int]], lo: int, hi: int) -> None:
+    """Mark [lo, hi) free, merging with overlapping or adjacent intervals."""
+    if lo >= hi:
+        return
+    i = bisect_left(free, lo, key=_END)
+    j = bisect_right(free, hi, key=_BEGIN)
+    if i < j:
+        lo = min(lo, free[i][0])
+        hi = max(hi, free[j - 1][1])
+    free[i:j] = [(lo, hi)]
+
+
+def _remove_range(free: list[tuple[int, int]], lo: int, hi: int) -> None:
+    """Mark [lo, hi) not free, splitting any interval it cuts through."""
+    if lo >= hi:
+        return
+    i = bisect_right(free, lo, key=_END)
+    j = bisect_left(free, hi, key=_BEGIN)
+    if i >= j:
+        return
+    pieces = []
+    if free[i][0] < lo:
+        pieces.append((free[i][0], lo))
+    if free[j - 1][1] > hi:
+        pieces.append((hi, free[j - 1][1]))
+    free[i:j] = pieces
+
+
+def walk(
+    occ: IntervalOccupancy,
+    operation_id: str,
+    earliest_start: int,
+    work_units: int,
+    allow_split: bool = False,
+    min_split: int = 1,
+    deadline: int | None = None,
+) -> AllocationRecord:
+    """Read-only: find earliest slot. Does NOT mutate the free list.
+
+    FR-022: Walk is read-only.
+    FR-011: Find earliest position where work fits.
+    FR-012/013/014: Non-splittable vs splittable with min_split.
+    FR-017: Deadline support.
+    """
+    if allow_split:
+        return _walk_splittable(
+            occ, operation_id, earliest_start, work_units, min_split, deadline
+        )
+    else:
+        return _walk_non_splittable(
+            occ, operation_id, earliest_start, work_units, deadline
+        )
+
+
+def _walk_non_splittable(
+    occ: IntervalOccupancy,
+    operation_id: str,
+    earliest_start: int,
+    work_units: int,
+    deadline: int | None,
+) -> AllocationRecord:
+    """Find the first free interval holding work_units from earliest_start on."""
+    pos = max(earliest_start, occ.horizon_begin)
+
+    while True:
+        if deadline is not None and pos >= deadline:
+            raise InfeasibleError(
+                operation_id=operation_id,
+                work_units_remaining=work_units,
+                work_units_requested=work_units,
+                reason="deadline",
+            )
+        if pos + work_units > occ.horizon_end:
+            # Extend with a one-day buffer
+            occ._extend_to(pos + work_units + occ._units_per_day)
+
+        limit = occ.horizon_end if deadline is None else min(occ.horizon_end, deadline)
+        resume = limit
+        free = occ.free
+        for begin, end in islice(free, bisect_right(free, pos, key=_END), None):
+            if begin >= limit:
+                break
+            run_start = max(begin, pos)
+            run_end = min(end, limit)
+            if run_end - run_start >= work_units:
+                return AllocationRecord(
+                    operation_id=operation_id,
+                    resource_id=occ.resource_id,
+                    start=run_start,
+                    finish=run_start + work_units,
+                    work_units=work_units,
+                    allow_split=False,
+                    spans=((run_start, run_start + work_units),),
+                )
+            if run_end == limit:
+                # Run is cut off by the scan end; it may continue past it
+                resume = run_start
+
+        if deadline is not None and limit >= deadline:
+            raise InfeasibleError(
+                operation_id=operation_id,
+                work_units_remaining=work_units,
+                work_units_requested=work_units,
+                reason="deadline",
+            )
+
+        # Need to extend further
+        occ._extend_to(occ.horizon_end + occ._extend_units)
+        pos = resume
+
+
+def _walk_splittable(
+    occ: IntervalOccupancy,
+    operation_id: str,
+    earliest_start: int,
+    work_units: int,
+    min_split: int,
+    deadline: int | None,
+) -> AllocationRecord:
+    """Greedy consumption across gaps, respecting min_split threshold."""
+    remaining = work_units
+    spans: list[tuple[int, int]] = []
+    pos = max(earliest_start, occ.horizon_begin)
+
+    while remaining > 0:
+        # Auto-extend if needed
+        if pos >= occ.horizon_end:
+            if deadline is not None and pos >= deadline:
+                raise InfeasibleError(
+                    operation_id=operation_id,
+                    work_units_remaining=remaining,
+                    work_units_requested=work_units,
+                    reason="deadline",
+                )
+            occ._extend_to(pos + occ._extend_units)
+
+        limit = occ.horizon_end if deadline is None else min(occ.horizon_end, deadline)
+        # A run reaching the scan end is only complete if the end is the deadline
+        bounded = deadline is not None and limit >= deadline
+        resume = limit
+        free = occ.free
+        for begin, end in islice(free, bisect_right(free, pos, key=_END), None):
+            if begin >= limit:
+                break
+            run_start = max(begin, pos)
+            run_end = min(end, limit)
+            run_length = run_end - run_start
+
+            if run_end == limit and not bounded and (
+                run_length < min_split or run_length < remaining
+            ):
+                # Run is cut off by the horizon and may continue past it;
+                # revisit it whole after extending
+                resume = run_start
+                break
+
+            # Check min_split threshold
+            if run_length < min_split:
+                continue
+
+            # Consume what we need
+            consume = min(run_length, remaining)
+            spans.append((run_start, run_start + consume))
+            remaining -= consume
+            if remaining <= 0:
+                break
+
+        if remaining > 0:
+            if bounded:
+                raise InfeasibleError(
+                    operation_id=operation_id,
+                    work_units_remaining=remaining,
+                    work_units_requested=work_units,
+                    reason="deadline",
+                )
+            # Extend and continue
+            pos = resume
+            occ._extend_to(limit + occ._extend_units)
+
+    return AllocationRecord(
+        operation_id=operation_id,
+        resource_id=occ.resource_id,
+        start=spans[0][0],
+        finish=spans[-1][1],
+        work_units=work_units,
+        allow_split=True,
+        spans=tuple(spans),
+    )
+
+
+def allocate(
+    occ: IntervalOccupancy,
+    operation_id: str,
+    earliest_start: int,
+    work_units: int,
+    allow_split: bool = False,
+    min_split: int = 1,
+    deadline: int | None = None,
+) -> AllocationRecord:
+    """Walk + commit. Returns allocation record. Raises InfeasibleError.
+
+    FR-015: Commit an allocation.
+    """
+    record = walk(
+        occ, operation_id, earliest_start, work_units,
+        allow_split, min_split, deadline,
+    )
+    for begin, end in record.spans:
+        _remove_range(occ.free, begin, end)
+    occ._allocations.append(record)
+    return record
+
+
+def apply_dynamic_exception(
+    occ: IntervalOccupancy,
+    start_offset: int,
+    end_offset: int,
+    is_working: bool,
+) -> list[AllocationRecord]:
+    """Apply a dynamic exception to the free list.
+
+    FR-009: Dynamic exceptions modify capacity mid-run.
+
+    is_working=False — capacity removal (breakdown, closure).
+        Removes the range and returns any allocations whose spans overlap
+        it (conflict detection).
+
+    is_working=True — capacity addition (overtime, extra shift).
+        Frees the range. Returns empty list (no conflicts possible).
+    """
+    lo = max(start_offset, occ.horizon_begin)
+    hi = min(end_offset, occ.horizon_end)
+
+    if is_working:
+        _add_range(occ.free, lo, hi)
+        return []
+
+    # Capacity removal: detect conflicts first, then remove the range
+    conflicts = [
+        record for record in occ._allocations
+        if overlaps(record, start_offset, end_offset)
+    ]
+
+    _remove_range(occ.free, lo, hi)
+
+    return conflicts
+
+
+def deallocate(occ: IntervalOccupancy, record: AllocationRecord) -> None:
+    """Release allocation. Exact inverse of allocate — returns spans to free.
+
+    FR-016: Release must be exact inverse.
+
+    Raises IndexError, before changing any state, if a span lies outside the
+    horizon. As in the bitmap engine, the record is dropped by value.
+    """
+    for begin, end in record.spans:
+        if begin < occ.horizon_begin or end > occ.horizon_end:
+            raise IndexError(
+                f"span [{begin}, {end}) outside horizon "
+                f"[{occ.horizon_begin}, {occ.horizon_end})"
+            )
+    for begin, end in record.spans:
+        _add_range(occ.free, begin, end)
+    forget(occ._allocations, record)
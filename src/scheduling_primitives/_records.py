@@ -0,0 +1,37 @@
+"""Allocation-record helpers shared by the bitmap and interval engines.
+
+Private: both engines keep their committed records in an ordered
+``_allocations`` list and use these to query and update it.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from operator import itemgetter
+
+from scheduling_primitives.types import AllocationRecord
+
+_SPAN_END = itemgetter(1)
+
+
+def overlaps(record: AllocationRecord, begin: int, end: int) -> bool:
+    """Whether any of the record's spans intersects [begin, end).
+
+    Spans are sorted and non-overlapping, so a binary search for the first
+    span ending after begin decides it.
+    """
+    spans = record.spans
+    i = bisect_right(spans, begin, key=_SPAN_END)
+    return i < len(spans) and spans[i][0] < end
+
+
+def forget(allocations: list[AllocationRecord], record: AllocationRecord) -> None:
+    """Drop one committed record matching `record`.
+
+    Matched by value, not identity: records come back from restore() as
+    equal copies of the ones allocate() returned.
+    """
+    try:
+        allocations.remove(record)
+    except ValueError:
+        pass
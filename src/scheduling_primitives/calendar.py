@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
+import heapq
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Iterator
 
+_ONE_MINUTE = timedelta(minutes=1)
 
+# Shared timedelta for every minute-of-day offset, 0..1440 inclusive
+_TD_MIN: tuple[timedelta, ...] = tuple(timedelta(minutes=m) for m in range(1441))
+
+# Upper bound on cached days per calendar (~11 years); oldest evicted first
+_INTERVAL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=2048)
 def _parse_time(s: str) -> time:
-    """Parse 'HH:MM' string to time object."""
+    """Parse 'HH:MM' string to time object.
+
+    Cached: there are at most 1440 distinct values and calendars loaded
+    together repeat the same few shift boundaries.
+    """
     parts = s.split(":")
     return time(int(parts[0]), int(parts[1]))
 
@@ -23,6 +39,25 @@ def _is_overnight(start: time, end: time) -> bool:
     return end < start
 
 
+def _period_minutes(start: time, end: time) -> tuple[int, int]:
+    """Period as half-open minute-of-day offsets; an end of 00:00 is 1440."""
+    end_min = 1440 if end == time(0, 0) else end.hour * 60 + end.minute
+    return (start.hour * 60 + start.minute, end_min)
+
+
+@dataclass(frozen=True, slots=True)
+class _ExceptionDay:
+    """Exception entries for one date, pre-digested at construction.
+
+    full_removal: an is_working=False entry without a time range removes the
+    whole day's rule periods. added: periods from is_working=True entries,
+    sorted by start.
+    """
+
+    full_removal: bool
+    added: tuple[tuple[time, time], ...]
+
+
 class WorkingCalendar:
     """Horizon-free calendar. Answers time queries by lazy day-by-day walk.
 
@@ -49,10 +84,47 @@ class WorkingCalendar:
             parsed.sort(key=lambda p: p[0])
             self._rules[day] = parsed
 
-        # Parse exceptions: ISO date string -> list of exception entries
-        self._exceptions: dict[str, list[dict]] = {}
+        # Resolved rule periods per weekday (0=Mon), including carryover from
+        # the previous day's overnight rules. Only depends on the weekday, so
+        # it is built once here instead of on every date lookup.
+        self._weekday_periods: list[list[tuple[time, time]]] = [
+            self._build_weekday_periods(wd) for wd in range(7)
+        ]
+        # Same tables as minute-of-day pairs. Overnight rules are already
+        # split at midnight, so every pair lies within [0, 1440].
+        self._weekday_minutes: list[list[tuple[int, int]]] = [
+            [_period_minutes(start, end) for start, end in periods]
+            for periods in self._weekday_periods
+        ]
+
+        # Parse exceptions: ISO date string -> the digested form
+        # _resolve_exceptions works from
+        self._exception_days: dict[str, _ExceptionDay] = {}
         for date_str, entries in exceptions.items():
-            self._exceptions[date_str] = entries
+            # Process exceptions in order:
+            # 1. If any is_working=False with no time range, it removes the entire day
+            # 2. is_working=True entries add periods
+            # 3. is_working=False with time range removes specific periods
+            #    (not yet needed)
+            full_removal = any(
+                not entry.get("is_working", True)
+                and "start" not in entry
+                and "end" not in entry
+                for entry in entries
+            )
+            added = [
+                (_parse_time(entry["start"]), _parse_time(entry["end"]))
+                for entry in entries
+                if entry.get("is_working", False)
+            ]
+            added.sort(key=lambda p: p[0])
+            self._exception_days[date_str] = _ExceptionDay(full_removal, tuple(added))
+
+        # Resolved datetime intervals per date ordinal. Rules and exceptions
+        # are fixed after construction, so entries never go stale.
+        self._interval_cache: dict[int, list[tuple[datetime, datetime]]] = {}
+        # Whole-day working minute totals per date ordinal (see _day_totals)
+        self._day_total_cache: dict[int, tuple[int, int, int]] = {}
 
     def periods_for_date(self, d: date) -> list[tuple[time, time]]:
         """Return the working periods for a specific date.
@@ -64,7 +136,7 @@ class WorkingCalendar:
         date_str = d.isoformat()
 
         # Check if there are exceptions for this date
-        if date_str in self._exceptions:
+        if date_str in self._exception_days:
             return self._resolve_exceptions(d)
 
         # No exceptions: build from rules + overnight carryover
@@ -72,7 +144,11 @@ class WorkingCalendar:
 
     def _resolve_rules(self, d: date) -> list[tuple[time, time]]:
         """Resolve working periods from weekly rules for a date."""
-        weekday = d.weekday()
+        # Copy: callers (including _resolve_exceptions) may append to it
+        return list(self._weekday_periods[d.weekday()])
+
+    def _build_weekday_periods(self, weekday: int) -> list[tuple[time, time]]:
+        """Build the sorted rule periods for one weekday."""
         periods: list[tuple[time, time]] = []
 
         # Same-day periods from this day's rules
@@ -85,8 +161,7 @@ class WorkingCalendar:
                     periods.append((start, end))
 
         # Carryover from previous day's overnight rules
-        prev_date = d - timedelta(days=1)
-        prev_weekday = prev_date.weekday()
+        prev_weekday = (weekday - 1) % 7
         if prev_weekday in self._rules:
             for start, end in self._rules[prev_weekday]:
                 if _is_overnight(start, end) and end != time(0, 0):
@@ -99,163 +174,276 @@ class WorkingCalendar:
 
     def _resolve_exceptions(self, d: date) -> list[tuple[time, time]]:
         """Resolve working periods when exceptions exist for a date."""
-        date_str = d.isoformat()
-        entries = self._exceptions[date_str]
-
-        # Process exceptions in order:
-        # 1. If any is_working=False with no time range, it removes the entire day
-        # 2. is_working=True entries add periods
-        # 3. is_working=False with time range removes specific periods (not yet needed)
-
-        has_full_removal = any(
-            not entry.get("is_working", True)
-            and "start" not in entry
-            and "end" not in entry
-            for entry in entries
-        )
+        exception_day = self._exception_days[d.isoformat()]
+        added = exception_day.added
 
-        if has_full_removal:
+        if exception_day.full_removal:
             # Start from empty, then add any is_working=True entries
-            periods: list[tuple[time, time]] = []
-            for entry in entries:
-                if entry.get("is_working", False):
-                    start = _parse_time(entry["start"])
-                    end = _parse_time(entry["end"])
-                    periods.append((start, end))
-        else:
-            # Start from rules, then apply modifications
-            periods = self._resolve_rules(d)
-            for entry in entries:
-                if not entry.get("is_working", True):
-                    # Remove specific period (future: implement partial removal)
-                    pass
-                elif entry.get("is_working", False):
-                    start = _parse_time(entry["start"])
-                    end = _parse_time(entry["end"])
-                    periods.append((start, end))
-
-        periods.sort(key=lambda p: p[0])
-        return periods
+            return list(added)
+
+        # Start from rules, then add is_working=True entries. Partial removal
+        # (is_working=False with a time range) is not yet implemented.
+        # Both inputs are already sorted by start, so a stable merge gives
+        # the same order as sorting their concatenation.
+        return list(
+            heapq.merge(self._weekday_periods[d.weekday()], added,
+                        key=lambda p: p[0])
+        )
 
     # ------------------------------------------------------------------
     # Layer 1 public API: time arithmetic (FR-001 through FR-005, FR-009)
     # ------------------------------------------------------------------
 
+    def _minute_periods_for_date(self, d: date) -> list[tuple[int, int]]:
+        """periods_for_date as minute-of-day pairs (1440 = end of day).
+
+        Rule-only dates are a direct weekday table lookup; read-only.
+        """
+        if d.isoformat() in self._exception_days:
+            return [
+                _period_minutes(start, end)
+                for start, end in self._resolve_exceptions(d)
+            ]
+        return self._weekday_minutes[d.weekday()]
+
     def _datetime_intervals_for_date(
         self, d: date
     ) -> list[tuple[datetime, datetime]]:
-        """Convert time-based periods to datetime intervals for a date."""
-        periods = self.periods_for_date(d)
-        result: list[tuple[datetime, datetime]] = []
+        """Convert time-based periods to datetime intervals for a date.
+
+        Memoised per date; callers must treat the returned list as read-only.
+        """
+        key = d.toordinal()
+        cached = self._interval_cache.get(key)
+        if cached is not None:
+            return cached
+
+        midnight = datetime.combine(d, time(0, 0))
+        result: list[tuple[datetime, datetime]] = [
+            (midnight + _TD_MIN[start], midnight + _TD_MIN[end])
+            for start, end in self._minute_periods_for_date(d)
+        ]
+
+        cache = self._interval_cache
+        if len(cache) >= _INTERVAL_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = result
+        return result
+
+    def _day_totals(self, d: date) -> tuple[int, int, int]:
+        """Working minutes in all of date ``d`` as (forward, backward, summed).
+
+        forward/backward are what add_minutes / subtract_minutes consume
+        walking through the whole day, computed with the same clipping so a
+        walk can skip a day it would fully consume. summed is the plain total
+        of period lengths, as counted by working_minutes_between. The three
+        differ only when a date's periods overlap.
+        """
+        key = d.toordinal()
+        cached = self._day_total_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Minute-of-day pairs: plain int arithmetic, no datetimes needed
+        periods = self._minute_periods_for_date(d)
+
+        forward = 0
+        cursor = 0
         for p_start, p_end in periods:
-            dt_start = datetime.combine(d, p_start)
-            if p_end == time(0, 0):
-                # Midnight = end of this day
-                dt_end = datetime.combine(d + timedelta(days=1), time(0, 0))
-            else:
-                dt_end = datetime.combine(d, p_end)
-            result.append((dt_start, dt_end))
+            if p_end > cursor:
+                available = p_end - max(p_start, cursor)
+                if available > 0:
+                    forward += available
+                    cursor = p_end
+
+        backward = 0
+        cursor = 1440
+        for p_start, p_end in reversed(periods):
+            if p_start < cursor:
+                available = min(p_end, cursor) - p_start
+                if available > 0:
+                    backward += available
+                    cursor = p_start
+
+        summed = sum(p_end - p_start for p_start, p_end in periods if p_start < p_end)
+
+        result = (forward, backward, summed)
+        cache = self._day_total_cache
+        if len(cache) >= _INTERVAL_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = result
         return result
 
+    def _skip_full_days(
+        self, ordinal: int, remaining: int, step: int, kind: int
+    ) -> tuple[int, int]:
+        """Step over whole days that ``remaining`` minutes run straight through.
+
+        Pure integer loop over date ordinals: starting at ``ordinal`` and
+        moving ``step`` days at a time, subtracts each day's ``kind`` total
+        (index into _day_totals) while the work outlasts it. Returns the
+        ordinal of the day the walk finishes in and the minutes left for it.
+        """
+        cache = self._day_total_cache
+        while True:
+            totals = cache.get(ordinal)
+            if totals is None:
+                totals = self._day_totals(date.fromordinal(ordinal))
+            day_total = totals[kind]
+            if remaining <= day_total:
+                return ordinal, remaining
+            remaining -= day_total
+            ordinal += step
+
     def add_minutes(self, start: datetime, minutes: int) -> datetime:
         """Forward walk: start + minutes of working time -> finish datetime.
 
         FR-001: Compute finish given start and working duration.
         FR-009: No horizon limit — walks day-by-day on demand.
         """
-        if minutes == 0:
+        if minutes <= 0:
             return start
 
-        remaining = minutes
         current_date = start.date()
+
+        # Fast path: short work that finishes in the first period it reaches
+        for iv_start, iv_end in self._datetime_intervals_for_date(current_date):
+            if iv_end > start:
+                effective_start = max(iv_start, start)
+                if minutes <= (iv_end - effective_start) // _ONE_MINUTE:
+                    return effective_start + timedelta(minutes=minutes)
+                break
+
+        # First (partial) day, in datetimes: ``start`` may carry seconds
+        remaining = minutes
         current_time = start
+        for iv_start, iv_end in self._datetime_intervals_for_date(current_date):
+            if iv_end <= current_time:
+                continue
 
-        while remaining > 0:
-            intervals = self._datetime_intervals_for_date(current_date)
+            effective_start = max(iv_start, current_time)
+            available = (iv_end - effective_start) // _ONE_MINUTE
 
-            for iv_start, iv_end in intervals:
-                if iv_end <= current_time:
-                    continue
+            if available <= 0:
+                continue
 
-                effective_start = max(iv_start, current_time)
-                available = int((iv_end - effective_start).total_seconds()) // 60
+            if remaining <= available:
+                return effective_start + timedelta(minutes=remaining)
+            remaining -= available
+            current_time = iv_end
 
-                if available <= 0:
-                    continue
+        # Skip whole days the remaining work runs straight through
+        ordinal, remaining = self._skip_full_days(
+            current_date.toordinal() + 1, remaining, 1, 0
+        )
 
-                if remaining <= available:
-                    return effective_start + timedelta(minutes=remaining)
-                else:
+        # Landing day, walked from midnight in integer minutes of day; it
+        # holds at least ``remaining`` minutes, so the walk finishes here
+        d = date.fromordinal(ordinal)
+        midnight = datetime.combine(d, time(0, 0))
+        cursor = 0
+        for p_start, p_end in self._minute_periods_for_date(d):
+            if p_end > cursor:
+                p_start = max(p_start, cursor)
+                available = p_end - p_start
+                if available > 0:
+                    if remaining <= available:
+                        return midnight + _TD_MIN[p_start + remaining]
                     remaining -= available
-                    current_time = iv_end
+                    cursor = p_end
 
-            current_date += timedelta(days=1)
-            current_time = datetime.combine(current_date, time(0, 0))
-
-        return current_time
+        return midnight + _TD_MIN[cursor]
 
     def subtract_minutes(self, end: datetime, minutes: int) -> datetime:
         """Backward walk: end - minutes of working time -> start datetime.
 
         FR-002: Compute start given finish and working duration.
         """
-        if minutes == 0:
+        if minutes <= 0:
             return end
 
-        remaining = minutes
         current_date = end.date()
+
+        # Fast path: short work that fits in the last period before ``end``
+        intervals = self._datetime_intervals_for_date(current_date)
+        for iv_start, iv_end in reversed(intervals):
+            if iv_start < end:
+                effective_end = min(iv_end, end)
+                if minutes <= (effective_end - iv_start) // _ONE_MINUTE:
+                    return effective_end - timedelta(minutes=minutes)
+                break
+
+        # First (partial) day, in datetimes: ``end`` may carry seconds
+        remaining = minutes
         current_time = end
+        for iv_start, iv_end in reversed(intervals):
+            if iv_start >= current_time:
+                continue
 
-        while remaining > 0:
-            intervals = self._datetime_intervals_for_date(current_date)
+            effective_end = min(iv_end, current_time)
+            available = (effective_end - iv_start) // _ONE_MINUTE
 
-            for iv_start, iv_end in reversed(intervals):
-                if iv_start >= current_time:
-                    continue
+            if available <= 0:
+                continue
 
-                effective_end = min(iv_end, current_time)
-                available = int((effective_end - iv_start).total_seconds()) // 60
+            if remaining <= available:
+                return effective_end - timedelta(minutes=remaining)
+            remaining -= available
+            current_time = iv_start
 
-                if available <= 0:
-                    continue
+        # Skip whole days the remaining work runs straight through
+        ordinal, remaining = self._skip_full_days(
+            current_date.toordinal() - 1, remaining, -1, 1
+        )
 
-                if remaining <= available:
-                    return effective_end - timedelta(minutes=remaining)
-                else:
+        # Landing day, walked back from midnight in integer minutes of day; it
+        # holds at least ``remaining`` minutes, so the walk finishes here
+        d = date.fromordinal(ordinal)
+        midnight = datetime.combine(d, time(0, 0))
+        cursor = 1440
+        for p_start, p_end in reversed(self._minute_periods_for_date(d)):
+            if p_start < cursor:
+                p_end = min(p_end, cursor)
+                available = p_end - p_start
+                if available > 0:
+                    if remaining <= available:
+                        return midnight + _TD_MIN[p_end - remaining]
                     remaining -= available
-                    current_time = iv_start
-
-            current_date -= timedelta(days=1)
-            current_time = datetime.combine(
-                current_date + timedelta(days=1), time(0, 0)
-            )
+                    cursor = p_start
 
-        return current_time
+        return midnight + _TD_MIN[cursor]
 
     def working_minutes_between(self, start: datetime, end: datetime) -> int:
         """Count working minutes in [start, end). FR-003."""
         if start >= end:
             return 0
 
-        total = 0
-        current_date = start.date()
+        start_date = start.date()
         end_date = end.date()
 
-        while current_date <= end_date:
-            intervals = self._datetime_intervals_for_date(current_date)
+        # Only the first and last dates can be partial; every date strictly
+        # between them lies entirely inside [start, end)
+        total = self._clipped_minutes(start_date, start, end)
+        if end_date > start_date:
+            cache = self._day_total_cache
+            for ordinal in range(start_date.toordinal() + 1, end_date.toordinal()):
+                totals = cache.get(ordinal)
+                if totals is None:
+                    totals = self._day_totals(date.fromordinal(ordinal))
+                total += totals[2]
+            total += self._clipped_minutes(end_date, start, end)
 
-            for iv_start, iv_end in intervals:
-                effective_start = max(iv_start, start)
-                effective_end = min(iv_end, end)
-
-                if effective_start < effective_end:
-                    minutes = int(
-                        (effective_end - effective_start).total_seconds()
-                    ) // 60
-                    total += minutes
+        return total
 
-            current_date += timedelta(days=1)
+    def _clipped_minutes(self, d: date, start: datetime, end: datetime) -> int:
+        """Working minutes of date ``d`` falling inside [start, end)."""
+        total = 0
+        for iv_start, iv_end in self._datetime_intervals_for_date(d):
+            effective_start = max(iv_start, start)
+            effective_end = min(iv_end, end)
 
+            if effective_start < effective_end:
+                total += (effective_end - effective_start) // _ONE_MINUTE
         return total
 
     def working_intervals_in_range(
@@ -265,17 +453,25 @@ class WorkingCalendar:
 
         FR-004: Enumerate individual working intervals.
         """
-        current_date = start.date()
+        start_date = start.date()
         end_date = end.date()
+        current_date = start_date
 
         while current_date <= end_date:
             intervals = self._datetime_intervals_for_date(current_date)
 
-            for iv_start, iv_end in intervals:
-                effective_start = max(iv_start, start)
-                effective_end = min(iv_end, end)
+            if start_date < current_date < end_date:
+                # Interior date: lies wholly inside [start, end), so the
+                # cached interval tuples are yielded as-is, unclipped
+                for interval in intervals:
+                    if interval[0] < interval[1]:
+                        yield interval
+            else:
+                for iv_start, iv_end in intervals:
+                    effective_start = max(iv_start, start)
+                    effective_end = min(iv_end, end)
 
-                if effective_start < effective_end:
-                    yield (effective_start, effective_end)
+                    if effective_start < effective_end:
+                        yield (effective_start, effective_end)
 
             current_date += timedelta(days=1)
@@ -92,13 +92,18 @@ def show_bitmap(
             idx = len(op_labels) % len(label_chars)
             op_labels[alloc.operation_id] = label_chars[idx]
 
-    # Build per-unit ownership: unit -> label char
-    unit_owner: dict[int, str] = {}
+    # Build per-unit ownership over the horizon: one byte per unit holding
+    # the owner's label char, 0 where unowned. Later allocations overwrite.
+    bits = bitmap.bits
+    n_bits = len(bits)
+    owner = bytearray(n_bits)
     for alloc in bitmap._allocations:
-        label = op_labels[alloc.operation_id]
+        label_byte = op_labels[alloc.operation_id].encode()
         for span_begin, span_end in alloc.spans:
-            for u in range(span_begin, span_end):
-                unit_owner[u] = label
+            lo = max(0, span_begin - bitmap.horizon_begin)
+            hi = min(n_bits, span_end - bitmap.horizon_begin)
+            if lo < hi:
+                owner[lo:hi] = label_byte * (hi - lo)
 
     # Header
     header_hours = "".join(f"{h:02d}" if h % 3 == 0 else "  " for h in range(24))
@@ -119,27 +124,33 @@ def show_bitmap(
             (datetime.combine(current_date, time(0, 0)) - epoch).total_seconds()
         ) // 60
 
+        # Whole-day short circuit: a day with no allocations and no free
+        # units (weekends, holidays, outside the horizon) is all '.'
+        day_lo = max(0, day_offset_minutes - bitmap.horizon_begin)
+        day_hi = min(n_bits, day_offset_minutes + 24 * 60 - bitmap.horizon_begin)
+        if day_lo >= day_hi or (
+            owner.count(0, day_lo, day_hi) == day_hi - day_lo
+            and bits.find(1, day_lo, day_hi) < 0
+        ):
+            lines.append(f"{label:>16s}  {''.join(row)}")
+            current_date += timedelta(days=1)
+            continue
+
         for char_idx in range(chars_per_day):
-            minute_start = day_offset_minutes + char_idx * minutes_per_char
-            minute_end = minute_start + minutes_per_char
-
-            # Check what's in this 30-minute block
-            has_free = False
-            has_alloc = False
-            alloc_label = None
-
-            for m in range(minute_start, minute_end):
-                bit_idx = m - bitmap.horizon_begin
-                if 0 <= bit_idx < len(bitmap.bits):
-                    if m in unit_owner:
-                        has_alloc = True
-                        alloc_label = unit_owner[m]
-                    elif bitmap.bits[bit_idx] == 1:
-                        has_free = True
-
-            if has_alloc and alloc_label:
-                row[char_idx] = alloc_label
-            elif has_free:
+            # Bit index range of this 30-minute block, clipped to the horizon
+            block_start = (day_offset_minutes + char_idx * minutes_per_char
+                           - bitmap.horizon_begin)
+            lo = max(0, block_start)
+            hi = min(n_bits, block_start + minutes_per_char)
+            if lo >= hi:
+                continue
+
+            # The last owned unit in the block labels it; otherwise any free
+            # unit marks it free. Both checks are C-level bytearray scans.
+            owned = owner[lo:hi].rstrip(b"\x00")
+            if owned:
+                row[char_idx] = chr(owned[-1])
+            elif bits.find(1, lo, hi) >= 0:
                 row[char_idx] = "-"
             # else: stays '.' (non-working)
 
@@ -14,7 +14,7 @@ from scheduling_primitives.occupancy import OccupancyBitmap, allocate
 from scheduling_primitives.types import AllocationRecord
 
 
-@dataclass
+@dataclass(slots=True)
 class Operation:
     """A unit of work to be scheduled on a specific resource."""
 
@@ -2,12 +2,36 @@
 
 from __future__ import annotations
 
+import copy
 import json
+from collections import OrderedDict
 from pathlib import Path
 
 from scheduling_primitives.calendar import WorkingCalendar
 from scheduling_primitives.schema import validate_exceptions, validate_rules
 
+try:
+    # Optional accelerator (extra: "orjson"); stdlib json otherwise
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+def _read_json(path: Path):
+    """Parse a JSON file from its raw bytes."""
+    return _loads(path.read_bytes())
+
+
+# Loaded calendars by resolved path -> (st_mtime_ns, calendar), least recently
+# used first. Callers get shallow copies; the cached instance never leaves.
+_CALENDAR_CACHE_SIZE = 32
+_calendar_cache: OrderedDict[str, tuple[int, WorkingCalendar]] = OrderedDict()
+
+
+def _clear_calendar_cache() -> None:
+    """Drop all calendars cached by load_calendar_json."""
+    _calendar_cache.clear()
+
 
 def load_calendar_json(path: str | Path) -> WorkingCalendar:
     """Load a WorkingCalendar from a JSON fixture file.
@@ -21,11 +45,23 @@ def load_calendar_json(path: str | Path) -> WorkingCalendar:
         }
     }
 
+    Repeat loads of an unchanged file skip parsing and validation. Each call
+    returns its own shallow copy of the cached calendar, so changing
+    attributes such as ``pattern_id`` does not affect other callers. The
+    cache holds the 32 most recently loaded files and is keyed on mtime, so
+    edits are picked up.
+
     Raises ValueError if validation fails.
     """
     path = Path(path)
-    with open(path) as f:
-        data = json.load(f)
+    key = str(path.resolve())
+    mtime = path.stat().st_mtime_ns
+    cached = _calendar_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        _calendar_cache.move_to_end(key)
+        return copy.copy(cached[1])
+
+    data = _read_json(path)
 
     cal_data = data.get("calendar", data)
     rules_raw = cal_data["rules"]
@@ -44,7 +80,12 @@ def load_calendar_json(path: str | Path) -> WorkingCalendar:
         )
 
     pattern_id = data.get("id", path.stem)
-    return WorkingCalendar(pattern_id, rules, exceptions)
+    calendar = WorkingCalendar(pattern_id, rules, exceptions)
+    _calendar_cache[key] = (mtime, calendar)
+    _calendar_cache.move_to_end(key)
+    if len(_calendar_cache) > _CALENDAR_CACHE_SIZE:
+        _calendar_cache.popitem(last=False)
+    return copy.copy(calendar)
 
 
 def load_multi_resource_json(
@@ -61,13 +102,25 @@ def load_multi_resource_json(
     }
     """
     path = Path(path)
-    with open(path) as f:
-        data = json.load(f)
+    data = _read_json(path)
+
+    # Resources sharing identical rules + exceptions are validated and parsed
+    # once. Later ones get a shallow copy under their own pattern_id, which
+    # also shares the (immutable-data) per-date caches between them.
+    by_definition: dict[str, WorkingCalendar] = {}
 
     calendars: dict[str, WorkingCalendar] = {}
     for resource_id, res_data in data["resources"].items():
-        rules = {int(k): v for k, v in res_data["rules"].items()}
         exceptions = res_data.get("exceptions", {})
+        key = json.dumps([res_data["rules"], exceptions], sort_keys=True)
+        shared = by_definition.get(key)
+        if shared is not None:
+            calendar = copy.copy(shared)
+            calendar.pattern_id = resource_id
+            calendars[resource_id] = calendar
+            continue
+
+        rules = {int(k): v for k, v in res_data["rules"].items()}
 
         errors = validate_rules(rules)
         errors.extend(validate_exceptions(exceptions))
@@ -77,6 +130,8 @@ def load_multi_resource_json(
                 + "\n".join(f"  - {e}" for e in errors)
             )
 
-        calendars[resource_id] = WorkingCalendar(resource_id, rules, exceptions)
+        calendar = WorkingCalendar(resource_id, rules, exceptions)
+        by_definition[key] = calendar
+        calendars[resource_id] = calendar
 
     return calendars
@@ -6,10 +6,13 @@ and auto-extending bitmap that grows on demand from the calendar.
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator
 
+from scheduling_primitives._records import forget, overlaps
+from scheduling_primitives.resolution import MINUTE
 from scheduling_primitives.types import AllocationRecord, InfeasibleError
 
 if TYPE_CHECKING:
@@ -20,6 +23,11 @@ if TYPE_CHECKING:
 # Default extension: 7 days worth of minutes
 _DEFAULT_EXTEND_DAYS = 7
 
+# checkpoint() layout: bit count header, raw bits, then one entry per
+# allocation record: _RECORD_HEADER, the utf-8 ids, and the flattened spans
+_SNAP_HEADER = struct.Struct("<Q")
+_RECORD_HEADER = struct.Struct("<IIqqq?I")
+
 
 @dataclass
 class OccupancyBitmap:
@@ -36,6 +44,13 @@ class OccupancyBitmap:
     _resolution: TimeResolution
     _epoch: datetime
     _allocations: list[AllocationRecord] = field(default_factory=list)
+    # Resolution-specific extension sizes, fixed at construction
+    _units_per_day: int = field(init=False, repr=False)
+    _extend_units: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._units_per_day = 24 * 60 * 60 // self._resolution.unit_seconds
+        self._extend_units = _DEFAULT_EXTEND_DAYS * self._units_per_day
 
     @property
     def horizon_end(self) -> int:
@@ -56,7 +71,6 @@ class OccupancyBitmap:
         FR-010: Materialise a working calendar into a capacity representation.
         """
         if resolution is None:
-            from scheduling_primitives.resolution import MINUTE
             resolution = MINUTE
 
         begin_int = resolution.to_int(horizon_start, epoch)
@@ -86,8 +100,7 @@ class OccupancyBitmap:
             return
 
         # Extend in chunks of at least 7 days
-        min_extend = _DEFAULT_EXTEND_DAYS * 24 * 60 * 60 // self._resolution.unit_seconds
-        new_end = max(needed_end, self.horizon_end + min_extend)
+        new_end = max(needed_end, self.horizon_end + self._extend_units)
 
         old_end = self.horizon_end
         extend_size = new_end - old_end
@@ -100,6 +113,12 @@ class OccupancyBitmap:
 
         self.bits.extend(new_bits)
 
+    def _free_in_range(self, begin: int, end: int) -> int:
+        """Number of free units in [begin, end), clipped to the horizon."""
+        lo = max(begin, self.horizon_begin) - self.horizon_begin
+        hi = min(end, self.horizon_end) - self.horizon_begin
+        return self.bits.count(1, lo, hi) if lo < hi else 0
+
     def copy(self) -> OccupancyBitmap:
         """Deep copy for branching."""
         return OccupancyBitmap(
@@ -113,21 +132,69 @@ class OccupancyBitmap:
         )
 
     def checkpoint(self) -> bytes:
-        """Immutable snapshot for backtracking."""
-        import pickle
-        return pickle.dumps((bytes(self.bits), list(self._allocations)))
+        """Immutable snapshot for backtracking.
+
+        The bits are copied raw behind a length header, followed by the
+        allocation records in struct-packed form.
+        """
+        return b"".join((
+            _SNAP_HEADER.pack(len(self.bits)),
+            self.bits,
+            *map(_pack_record, self._allocations),
+        ))
 
     def restore(self, snap: bytes) -> None:
         """Restore to snapshot. Mutates in place."""
-        import pickle
-        bits_data, allocations = pickle.loads(snap)
-        self.bits[:] = bits_data
-        # If snapshot was from a shorter bitmap, truncate
-        if len(bits_data) < len(self.bits):
-            del self.bits[len(bits_data):]
+        view = memoryview(snap)
+        (size,) = _SNAP_HEADER.unpack_from(view)
+        pos = _SNAP_HEADER.size + size
+        # Replaces the whole buffer, so a shorter snapshot also truncates
+        self.bits[:] = view[_SNAP_HEADER.size:pos]
+        allocations = []
+        while pos < len(view):
+            record, pos = _unpack_record(view, pos)
+            allocations.append(record)
         self._allocations = allocations
 
 
+def _pack_record(record: AllocationRecord) -> bytes:
+    """Encode one allocation record for checkpoint()."""
+    op_id = record.operation_id.encode()
+    res_id = record.resource_id.encode()
+    flat = [unit for span in record.spans for unit in span]
+    return b"".join((
+        _RECORD_HEADER.pack(
+            len(op_id), len(res_id), record.start, record.finish,
+            record.work_units, record.allow_split, len(record.spans),
+        ),
+        op_id,
+        res_id,
+        struct.pack(f"<{len(flat)}q", *flat),
+    ))
+
+
+def _unpack_record(view: memoryview, pos: int) -> tuple[AllocationRecord, int]:
+    """Decode the record _pack_record wrote at `pos`; return it and the next offset."""
+    (op_len, res_len, start, finish, work_units, allow_split,
+     n_spans) = _RECORD_HEADER.unpack_from(view, pos)
+    pos += _RECORD_HEADER.size
+    op_id = str(view[pos:pos + op_len], "utf-8")
+    pos += op_len
+    res_id = str(view[pos:pos + res_len], "utf-8")
+    pos += res_len
+    flat = struct.unpack_from(f"<{2 * n_spans}q", view, pos)
+    pos += 16 * n_spans
+    record = AllocationRecord(
+        operation_id=op_id,
+        resource_id=res_id,
+        start=start,
+        finish=finish,
+        work_units=work_units,
+        allow_split=allow_split,
+        spans=tuple(zip(flat[::2], flat[1::2])),
+    )
+    return record, pos
+
 def _fill_bits_from_calendar(
     bits: bytearray,
     bits_offset: int,
@@ -140,11 +207,13 @@ def _fill_bits_from_calendar(
     dt_start = resolution.to_datetime(bits_offset, epoch)
     dt_end = resolution.to_datetime(bits_offset + len(bits), epoch)
 
+    n = len(bits)
     for iv_start, iv_end in cal.working_intervals_in_range(dt_start, dt_end):
-        start_int = resolution.to_int(iv_start, epoch) - bits_offset
-        end_int = resolution.to_int(iv_end, epoch) - bits_offset
-        for i in range(max(0, start_int), min(len(bits), end_int)):
-            bits[i] = 1
+        lo = max(0, resolution.to_int(iv_start, epoch) - bits_offset)
+        hi = min(n, resolution.to_int(iv_end, epoch) - bits_offset)
+        if lo < hi:
+            # Slice assignment: one C-level fill per interval, not per unit
+            bits[lo:hi] = b"\x01" * (hi - lo)
 
 
 def walk(
@@ -183,6 +252,7 @@ def _walk_non_splittable(
     """Find earliest contiguous free run >= work_units."""
     pos = max(earliest_start, bitmap.horizon_begin)
     effective_deadline = deadline
+    needle = b"\x01" * max(work_units, 1)
 
     while True:
         # Auto-extend if needed
@@ -194,43 +264,38 @@ def _walk_non_splittable(
                     work_units_requested=work_units,
                     reason="deadline",
                 )
-            bitmap._extend_to(pos + work_units + 1440)  # Extend with buffer
-
-        # Scan for contiguous free run
-        run_start = None
-        run_length = 0
+            # Extend with a one-day buffer
+            bitmap._extend_to(pos + work_units + bitmap._units_per_day)
 
+        # Search for the whole free run at once: a single C-level substring
+        # find() rather than measuring runs one at a time
         scan_end = min(
             bitmap.horizon_end,
             effective_deadline if effective_deadline is not None else bitmap.horizon_end,
         )
 
-        i = pos - bitmap.horizon_begin
-        while i < scan_end - bitmap.horizon_begin:
-            abs_pos = i + bitmap.horizon_begin
-
-            if bitmap.bits[i] == 1:
-                if run_start is None:
-                    run_start = abs_pos
-                    run_length = 1
-                else:
-                    run_length += 1
-
-                if run_length >= work_units:
-                    return AllocationRecord(
-                        operation_id=operation_id,
-                        resource_id=bitmap.resource_id,
-                        start=run_start,
-                        finish=run_start + work_units,
-                        work_units=work_units,
-                        allow_split=False,
-                        spans=((run_start, run_start + work_units),),
-                    )
-            else:
-                run_start = None
-                run_length = 0
-
-            i += 1
+        bits = bitmap.bits
+        base = bitmap.horizon_begin
+        i = pos - base
+        # Clamp: a deadline before the horizon would give a negative limit,
+        # which find()/rfind() read as an offset from the end of the bitmap
+        limit = max(scan_end - base, i)
+        found = bits.find(needle, i, limit)
+        if found >= 0:
+            run_start = found + base
+            return AllocationRecord(
+                operation_id=operation_id,
+                resource_id=bitmap.resource_id,
+                start=run_start,
+                finish=run_start + work_units,
+                work_units=work_units,
+                allow_split=False,
+                spans=((run_start, run_start + work_units),),
+            )
+
+        # A free run cut off by the scan end may continue past it
+        tail = max(bits.rfind(0, i, limit) + 1, i)
+        resume = tail + base if tail < limit else scan_end
 
         # If we scanned up to deadline and didn't find a fit
         if effective_deadline is not None and scan_end >= effective_deadline:
@@ -243,8 +308,8 @@ def _walk_non_splittable(
 
         # Need to extend further
         if pos + work_units > bitmap.horizon_end:
-            bitmap._extend_to(bitmap.horizon_end + _DEFAULT_EXTEND_DAYS * 1440)
-        pos = scan_end
+            bitmap._extend_to(bitmap.horizon_end + bitmap._extend_units)
+        pos = resume
 
 
 def _walk_splittable(
@@ -261,6 +326,18 @@ def _walk_splittable(
     pos = max(earliest_start, bitmap.horizon_begin)
     first_start: int | None = None
 
+    # With every run usable and the deadline already materialised, the free
+    # count decides infeasibility (and the exact shortfall) without a scan
+    if deadline is not None and min_split <= 1 and deadline <= bitmap.horizon_end:
+        available = bitmap._free_in_range(pos, deadline)
+        if available < work_units:
+            raise InfeasibleError(
+                operation_id=operation_id,
+                work_units_remaining=work_units - available,
+                work_units_requested=work_units,
+                reason="deadline",
+            )
+
     while remaining > 0:
         # Auto-extend if needed
         if pos >= bitmap.horizon_end:
@@ -271,45 +348,43 @@ def _walk_splittable(
                     work_units_requested=work_units,
                     reason="deadline",
                 )
-            bitmap._extend_to(pos + _DEFAULT_EXTEND_DAYS * 1440)
+            bitmap._extend_to(pos + bitmap._extend_units)
 
         effective_end = min(
             bitmap.horizon_end,
             deadline if deadline is not None else bitmap.horizon_end,
         )
 
-        # Find next free run
-        i = pos - bitmap.horizon_begin
-        while i < effective_end - bitmap.horizon_begin:
-            if bitmap.bits[i] == 1:
-                # Found start of free run
-                run_start = i + bitmap.horizon_begin
-                run_end = run_start
-                while (
-                    run_end - bitmap.horizon_begin < effective_end - bitmap.horizon_begin
-                    and bitmap.bits[run_end - bitmap.horizon_begin] == 1
-                ):
-                    run_end += 1
-
-                run_length = run_end - run_start
-
-                # Check min_split threshold
-                if run_length < min_split:
-                    i = run_end - bitmap.horizon_begin
-                    continue
-
-                # Consume what we need
-                consume = min(run_length, remaining)
-                spans.append((run_start, run_start + consume))
-                if first_start is None:
-                    first_start = run_start
-                remaining -= consume
-                i = run_end - bitmap.horizon_begin
-
-                if remaining <= 0:
-                    break
-            else:
-                i += 1
+        base = bitmap.horizon_begin
+        limit = effective_end - base
+        # A run reaching the scan end is only complete if the end is the deadline
+        bounded = deadline is not None and effective_end >= deadline
+        resume = effective_end
+        for i, run_end in _iter_free_runs(bitmap.bits, pos - base, limit):
+            run_start = i + base
+            run_length = run_end - i
+
+            if run_end == limit and not bounded and (
+                run_length < min_split or run_length < remaining
+            ):
+                # Run is cut off by the horizon and may continue past it;
+                # revisit it whole after extending
+                resume = run_start
+                break
+
+            # Check min_split threshold
+            if run_length < min_split:
+                continue
+
+            # Consume what we need
+            consume = min(run_length, remaining)
+            spans.append((run_start, run_start + consume))
+            if first_start is None:
+                first_start = run_start
+            remaining -= consume
+
+            if remaining <= 0:
+                break
 
         if remaining > 0:
             if deadline is not None and effective_end >= deadline:
@@ -320,9 +395,9 @@ def _walk_splittable(
                     reason="deadline",
                 )
             # Extend and continue
-            pos = effective_end
-            if pos >= bitmap.horizon_end:
-                bitmap._extend_to(pos + _DEFAULT_EXTEND_DAYS * 1440)
+            pos = resume
+            if effective_end >= bitmap.horizon_end:
+                bitmap._extend_to(effective_end + bitmap._extend_units)
 
     last_end = spans[-1][1]
     return AllocationRecord(
@@ -336,16 +411,58 @@ def _walk_splittable(
     )
 
 
+def _iter_free_runs(bits: bytearray, lo: int, hi: int) -> Iterator[tuple[int, int]]:
+    """Yield maximal free runs (begin, end) of bits[lo:hi] as bit indices.
+
+    Jumps between run boundaries with C-level find() rather than testing
+    one unit at a time. A run reaching hi is cut off there.
+    """
+    find = bits.find
+    i = find(1, lo, hi) if lo < hi else -1
+    while i >= 0:
+        run_end = find(0, i, hi)
+        if run_end < 0:
+            yield i, hi
+            return
+        yield i, run_end
+        i = find(1, run_end, hi)
+
+
 def _mark_spans(
     bitmap: OccupancyBitmap,
     spans: tuple[tuple[int, int], ...],
     value: int,
 ) -> None:
-    """Set bits for all spans to the given value (0=occupied, 1=free)."""
+    """Set bits for all spans to the given value (0=occupied, 1=free).
+
+    Raises IndexError, before changing any bits, if a span lies outside the
+    bitmap's horizon.
+    """
+    base = bitmap.horizon_begin
+    horizon_end = bitmap.horizon_end
     for begin, end in spans:
-        offset = begin - bitmap.horizon_begin
-        for i in range(offset, offset + (end - begin)):
-            bitmap.bits[i] = value
+        if begin < base or end > horizon_end:
+            raise IndexError(
+                f"span [{begin}, {end}) outside bitmap horizon "
+                f"[{base}, {horizon_end})"
+            )
+
+    bits = bitmap.bits
+    fill = b"\x01" if value else b"\x00"
+    for begin, end in spans:
+        if begin < end:
+            bits[begin - base:end - base] = fill * (end - begin)
+
+
+def _set_range(bits: bytearray, lo: int, hi: int, fill: bytes) -> None:
+    """Set bits[lo:hi] (clipped to the bitmap) to a single-byte fill value.
+
+    Only for dynamic exceptions, which may name time outside the horizon.
+    """
+    lo = max(0, lo)
+    hi = min(len(bits), hi)
+    if lo < hi:
+        bits[lo:hi] = fill * (hi - lo)
 
 
 def allocate(
@@ -391,20 +508,16 @@ def apply_dynamic_exception(
     offset_end = end_offset - bitmap.horizon_begin
 
     if is_working:
-        for i in range(max(0, offset_begin), min(len(bitmap.bits), offset_end)):
-            bitmap.bits[i] = 1
+        _set_range(bitmap.bits, offset_begin, offset_end, b"\x01")
         return []
 
     # Capacity removal: detect conflicts first, then set bits
-    conflicts: list[AllocationRecord] = []
-    for record in bitmap._allocations:
-        for span_start, span_end in record.spans:
-            if span_start < end_offset and start_offset < span_end:
-                conflicts.append(record)
-                break
+    conflicts = [
+        record for record in bitmap._allocations
+        if overlaps(record, start_offset, end_offset)
+    ]
 
-    for i in range(max(0, offset_begin), min(len(bitmap.bits), offset_end)):
-        bitmap.bits[i] = 0
+    _set_range(bitmap.bits, offset_begin, offset_end, b"\x00")
 
     return conflicts
 
@@ -413,6 +526,10 @@ def deallocate(bitmap: OccupancyBitmap, record: AllocationRecord) -> None:
     """Release allocation. Exact inverse of allocate — restores bits to free.
 
     FR-016: Release must be exact inverse.
+
+    The committed record is found by value, not identity, because restore()
+    rebuilds records as equal copies. A record that is not committed only
+    has its spans freed.
     """
     _mark_spans(bitmap, record.spans, 1)
-    bitmap._allocations = [a for a in bitmap._allocations if a is not record]
+    forget(bitmap._allocations, record)
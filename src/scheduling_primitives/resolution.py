@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 
 
 def _reject_aware(dt: datetime, name: str) -> None:
@@ -33,26 +34,37 @@ class TimeResolution:
         Raises TypeError if dt or epoch is timezone-aware.
         Raises ValueError if dt is not aligned to the resolution.
         """
-        _reject_aware(dt, "dt")
-        _reject_aware(epoch, "epoch")
-
-        delta_seconds = int((dt - epoch).total_seconds())
-        remainder = delta_seconds % self.unit_seconds
-        if remainder != 0:
-            raise ValueError(
-                f"datetime {dt.isoformat()} does not align to {self.label} "
-                f"resolution (unit_seconds={self.unit_seconds}). "
-                f"Remainder: {remainder}s. "
-                f"No implicit rounding — caller must ensure alignment."
-            )
-        return delta_seconds // self.unit_seconds
+        return _to_int(self.unit_seconds, self.label, dt, epoch)
 
     def to_datetime(self, t: int, epoch: datetime) -> datetime:
         """Convert integer units from epoch to datetime."""
-        _reject_aware(epoch, "epoch")
-        from datetime import timedelta
+        return _to_datetime(self.unit_seconds, t, epoch)
 
-        return epoch + timedelta(seconds=t * self.unit_seconds)
+
+# Calendar materialisation converts the same period boundaries for every
+# bitmap built or extended over them, so conversions are memoised. Errors
+# are raised on every call: lru_cache does not cache exceptions.
+@lru_cache(maxsize=4096)
+def _to_int(unit_seconds: int, label: str, dt: datetime, epoch: datetime) -> int:
+    _reject_aware(dt, "dt")
+    _reject_aware(epoch, "epoch")
+
+    delta_seconds = int((dt - epoch).total_seconds())
+    remainder = delta_seconds % unit_seconds
+    if remainder != 0:
+        raise ValueError(
+            f"datetime {dt.isoformat()} does not align to {label} "
+            f"resolution (unit_seconds={unit_seconds}). "
+            f"Remainder: {remainder}s. "
+            f"No implicit rounding — caller must ensure alignment."
+        )
+    return delta_seconds // unit_seconds
+
+
+@lru_cache(maxsize=4096)
+def _to_datetime(unit_seconds: int, t: int, epoch: datetime) -> datetime:
+    _reject_aware(epoch, "epoch")
+    return epoch + timedelta(seconds=t * unit_seconds)
 
 
 MINUTE = TimeResolution(unit_seconds=60, label="minute")
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache, wraps
 from pathlib import Path
 
 import pytest
@@ -96,11 +97,34 @@ def parse_time_pair(pair: list[str]) -> tuple[time, time]:
     )
 
 
+# ---------------------------------------------------------------------------
+# Cached templates
+# ---------------------------------------------------------------------------
+def cached_copies(build):
+    """Decorator: run `build` once per argument tuple, return a .copy() per call.
+
+    The cached result is a template that is treated as read-only and never
+    handed out, so every caller can mutate what it gets.
+    """
+    template = lru_cache(maxsize=None)(build)
+
+    @wraps(build)
+    def fresh_copy(*args):
+        return template(*args).copy()
+
+    return fresh_copy
+
+
 # ---------------------------------------------------------------------------
 # Calendar factory
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=None)
 def make_calendar(name: str):
-    """Build a WorkingCalendar from calendars.json by name."""
+    """Build a WorkingCalendar from calendars.json by name.
+
+    Cached per name, so the calendar is shared and must be treated as
+    read-only.
+    """
     from scheduling_primitives.calendar import WorkingCalendar
 
     config = _calendars[name]
@@ -121,6 +145,14 @@ def make_bitmap(calendar_name: str = "standard",
     Defaults to the full canonical week (Mon-Sun) at MINUTE resolution.
     Pass resolution="hour" for hour-grain bitmaps.
     """
+    return _bitmap(calendar_name, horizon_start, horizon_end, resolution)
+
+
+@cached_copies
+def _bitmap(calendar_name: str,
+            horizon_start: str | None,
+            horizon_end: str | None,
+            resolution: str):
     from scheduling_primitives.occupancy import OccupancyBitmap
     from scheduling_primitives.resolution import HOUR, MINUTE
 
@@ -131,11 +163,48 @@ def make_bitmap(calendar_name: str = "standard",
     return OccupancyBitmap.from_calendar(cal, h_start, h_end, EPOCH, res)
 
 
+def make_intervals(calendar_name: str = "standard",
+                   horizon_start: str | None = None,
+                   horizon_end: str | None = None,
+                   resolution: str = "minute"):
+    """Build an IntervalOccupancy from a named calendar.
+
+    Same defaults as make_bitmap, so both engines cover the same horizon.
+    """
+    from scheduling_primitives._intervals import IntervalOccupancy
+    from scheduling_primitives.resolution import HOUR, MINUTE
+
+    res = HOUR if resolution == "hour" else MINUTE
+    cal = make_calendar(calendar_name)
+    h_start = datetime.fromisoformat(horizon_start) if horizon_start else day_dt("mon")
+    h_end = datetime.fromisoformat(horizon_end) if horizon_end else day_dt("next_mon")
+    return IntervalOccupancy.from_calendar(cal, h_start, h_end, EPOCH, res)
+
+
+def first_mismatch(bits: bytearray, lo: int, hi: int, value: int) -> int | None:
+    """First index in [lo, hi) whose bit is not `value`, or None if all match.
+
+    One C-level slice comparison in the common all-match case. An index
+    past the end of `bits` counts as a mismatch.
+    """
+    window = bits[lo:hi]
+    if window == bytes([value]) * (hi - lo):
+        return None
+    return lo + next(
+        (k for k, b in enumerate(window) if b != value), len(window)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Scenario loader
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=None)
 def load_scenarios(name: str):
-    """Load a scenario file from data/fixtures/scenarios/{name}.json."""
+    """Load a scenario file from data/fixtures/scenarios/{name}.json.
+
+    Cached per name, so the returned data is shared and must be treated as
+    read-only.
+    """
     return _load_json(SCENARIOS_DIR / f"{name}.json")
 
 
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import pytest
 
-from conftest import load_scenarios, make_bitmap
+from conftest import first_mismatch, load_scenarios, make_bitmap
 
 _data = load_scenarios("allocate")
 
@@ -35,8 +35,8 @@ class TestAllocate:
         assert record.spans == expected_spans
 
         lo, hi = spec["check_bits_zero_range"]
-        for i in range(lo, hi):
-            assert bm.bits[i] == 0, f"bit {i} should be occupied after allocate"
+        bad = first_mismatch(bm.bits, lo, hi, 0)
+        assert bad is None, f"bit {bad} should be occupied after allocate"
 
     def test_allocate_returns_correct_record(self):
         """Returned AllocationRecord has correct fields."""
@@ -82,7 +82,7 @@ class TestDeallocate:
                           earliest_start=spec["earliest_start"],
                           work_units=spec["work_units"])
         deallocate(bm, record)
-        assert bytes(bm.bits) == bits_before
+        assert bm.bits == bits_before
 
     def test_deallocate_exact_inverse(self):
         """State after deallocate is bit-identical to state before allocate."""
@@ -100,7 +100,7 @@ class TestDeallocate:
         # Deallocate in reverse order
         for r in reversed(records):
             deallocate(bm, r)
-        assert bytes(bm.bits) == snap
+        assert bm.bits == snap
 
     def test_splittable_deallocate(self):
         """Deallocate a splittable allocation restores all spans."""
@@ -115,4 +115,22 @@ class TestDeallocate:
                           allow_split=spec.get("allow_split", False))
         assert len(record.spans) == spec["expected_span_count"]
         deallocate(bm, record)
-        assert bytes(bm.bits) == snap
+        assert bm.bits == snap
+
+    def test_deallocate_outside_horizon_raises(self):
+        """A record outside the bitmap's horizon is rejected, not clipped."""
+        from scheduling_primitives.occupancy import deallocate
+        from scheduling_primitives.types import AllocationRecord
+
+        bm = make_bitmap("standard")
+        snap = bytes(bm.bits)
+        for spans in [((480, 540), (20000, 20060)), ((-60, 0),)]:
+            record = AllocationRecord(
+                operation_id="OP-X", resource_id=bm.resource_id,
+                start=spans[0][0], finish=spans[-1][1],
+                work_units=sum(end - begin for begin, end in spans),
+                allow_split=len(spans) > 1, spans=spans,
+            )
+            with pytest.raises(IndexError):
+                deallocate(bm, record)
+            assert bm.bits == snap, "no span may be applied before the error"
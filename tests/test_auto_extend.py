@@ -69,3 +69,32 @@ class TestAutoExtend:
                 assert r.start == step["expected_start"], spec["notes"]
             if "expected_start_gte" in step:
                 assert r.start >= step["expected_start_gte"], spec["notes"]
+
+    def test_non_splittable_run_straddling_horizon(self):
+        """A free run cut off by the horizon end is found whole after extension."""
+        from scheduling_primitives.occupancy import walk
+
+        spec = _get("run_straddles_horizon")
+        bm = make_bitmap(spec["calendar"], horizon_end=spec["horizon_end"])
+
+        record = walk(bm, spec["operation_id"],
+                      earliest_start=spec["earliest_start"],
+                      work_units=spec["work_units"],
+                      allow_split=spec["allow_split"])
+        assert record.start == spec["expected_start"], spec["notes"]
+        assert record.finish == spec["expected_start"] + spec["work_units"]
+
+    def test_splittable_run_straddling_horizon(self):
+        """min_split is judged on a horizon-cut run's full length, not the cut."""
+        from scheduling_primitives.occupancy import walk
+
+        spec = _get("split_run_straddles_horizon")
+        bm = make_bitmap(spec["calendar"], horizon_end=spec["horizon_end"])
+
+        record = walk(bm, spec["operation_id"],
+                      earliest_start=spec["earliest_start"],
+                      work_units=spec["work_units"],
+                      allow_split=spec["allow_split"],
+                      min_split=spec["min_split"])
+        expected = tuple(tuple(sp) for sp in spec["expected_spans"])
+        assert record.spans == expected, spec["notes"]
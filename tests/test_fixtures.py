@@ -11,38 +11,56 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
+from conftest import cached_copies
+
 FIXTURES_DIR = Path(__file__).resolve().parent.parent / "data" / "fixtures"
 
 # Load all contract fixtures
 _CONTRACT_FILES = ["simple", "multi_shift", "overnight", "resource_variety", "stress"]
-_CONTRACTS: dict[str, dict] = {}
-for _name in _CONTRACT_FILES:
-    _path = FIXTURES_DIR / f"{_name}.json"
-    with open(_path) as f:
-        _CONTRACTS[_name] = json.load(f)
+_CONTRACTS: dict[str, dict] = {
+    name: json.loads((FIXTURES_DIR / f"{name}.json").read_bytes())
+    for name in _CONTRACT_FILES
+}
+
+
+def _calendar_config(fixture_id: str, resource_id: str | None) -> dict:
+    """Return the calendar block for a fixture (or one of its resources)."""
+    fixture = _CONTRACTS[fixture_id]
+    if resource_id is None:
+        return fixture["calendar"]
+    return fixture["resources"][resource_id]
 
 
-def _build_calendar(rules: dict, exceptions: dict):
-    """Build a WorkingCalendar from rules/exceptions dicts."""
+@lru_cache(maxsize=None)
+def _build_calendar(fixture_id: str, resource_id: str | None = None):
+    """Build a WorkingCalendar from contract fixture data (shared, read-only)."""
     from scheduling_primitives.calendar import WorkingCalendar
 
-    int_rules = {int(k): v for k, v in rules.items()}
-    return WorkingCalendar("contract", int_rules, exceptions)
+    config = _calendar_config(fixture_id, resource_id)
+    int_rules = {int(k): v for k, v in config["rules"].items()}
+    return WorkingCalendar("contract", int_rules, config.get("exceptions", {}))
 
 
-def _build_bitmap(rules, exceptions, epoch_str, horizon):
-    """Build an OccupancyBitmap from contract fixture data."""
+def _build_bitmap(fixture_id: str, resource_id: str | None = None):
+    """Build an OccupancyBitmap over the fixture's own epoch and horizon."""
+    return _bitmap(fixture_id, resource_id)
+
+
+@cached_copies
+def _bitmap(fixture_id: str, resource_id: str | None):
     from scheduling_primitives.occupancy import OccupancyBitmap
     from scheduling_primitives.resolution import MINUTE
 
-    cal = _build_calendar(rules, exceptions)
-    epoch = datetime.fromisoformat(epoch_str)
-    h_start = datetime.fromisoformat(horizon["start"])
-    h_end = datetime.fromisoformat(horizon["end"])
+    fixture = _CONTRACTS[fixture_id]
+    cal = _build_calendar(fixture_id, resource_id)
+    epoch = datetime.fromisoformat(fixture["epoch"])
+    h_start = datetime.fromisoformat(fixture["horizon"]["start"])
+    h_end = datetime.fromisoformat(fixture["horizon"]["end"])
     return OccupancyBitmap.from_calendar(cal, h_start, h_end, epoch, MINUTE)
 
 
@@ -58,7 +76,7 @@ def _get_single_cal_forward_walk_cases():
     for fid in _SINGLE_CAL_IDS:
         fixture = _CONTRACTS[fid]
         for tc in fixture.get("tests", {}).get("forward_walk", []):
-            cases.append(pytest.param(fixture, tc, id=f"{fid}_{tc['id']}"))
+            cases.append(pytest.param(fid, tc, id=f"{fid}_{tc['id']}"))
     return cases
 
 
@@ -67,7 +85,7 @@ def _get_single_cal_working_minutes_cases():
     for fid in _SINGLE_CAL_IDS:
         fixture = _CONTRACTS[fid]
         for tc in fixture.get("tests", {}).get("working_minutes", []):
-            cases.append(pytest.param(fixture, tc, id=f"{fid}_{tc['id']}"))
+            cases.append(pytest.param(fid, tc, id=f"{fid}_{tc['id']}"))
     return cases
 
 
@@ -76,19 +94,16 @@ def _get_single_cal_allocation_cases():
     for fid in _SINGLE_CAL_IDS:
         fixture = _CONTRACTS[fid]
         for tc in fixture.get("tests", {}).get("allocations", []):
-            cases.append(pytest.param(fixture, tc, id=f"{fid}_{tc['id']}"))
+            cases.append(pytest.param(fid, tc, id=f"{fid}_{tc['id']}"))
     return cases
 
 
 class TestForwardWalk:
     """calendar.add_minutes matches expected finish across all fixtures."""
 
-    @pytest.mark.parametrize("fixture, tc", _get_single_cal_forward_walk_cases())
-    def test_forward_walk(self, fixture, tc):
-        cal = _build_calendar(
-            fixture["calendar"]["rules"],
-            fixture["calendar"].get("exceptions", {}),
-        )
+    @pytest.mark.parametrize("fixture_id, tc", _get_single_cal_forward_walk_cases())
+    def test_forward_walk(self, fixture_id, tc):
+        cal = _build_calendar(fixture_id)
         start = datetime.fromisoformat(tc["start"])
         expected = datetime.fromisoformat(tc["expected"])
 
@@ -99,12 +114,9 @@ class TestForwardWalk:
 class TestWorkingMinutes:
     """working_minutes_between matches expected across all fixtures."""
 
-    @pytest.mark.parametrize("fixture, tc", _get_single_cal_working_minutes_cases())
-    def test_working_minutes(self, fixture, tc):
-        cal = _build_calendar(
-            fixture["calendar"]["rules"],
-            fixture["calendar"].get("exceptions", {}),
-        )
+    @pytest.mark.parametrize("fixture_id, tc", _get_single_cal_working_minutes_cases())
+    def test_working_minutes(self, fixture_id, tc):
+        cal = _build_calendar(fixture_id)
         start = datetime.fromisoformat(tc["start"])
         end = datetime.fromisoformat(tc["end"])
 
@@ -115,16 +127,11 @@ class TestWorkingMinutes:
 class TestAllocations:
     """Allocations match expected start/finish/spans across all fixtures."""
 
-    @pytest.mark.parametrize("fixture, tc", _get_single_cal_allocation_cases())
-    def test_allocation(self, fixture, tc):
+    @pytest.mark.parametrize("fixture_id, tc", _get_single_cal_allocation_cases())
+    def test_allocation(self, fixture_id, tc):
         from scheduling_primitives.occupancy import allocate
 
-        bm = _build_bitmap(
-            fixture["calendar"]["rules"],
-            fixture["calendar"].get("exceptions", {}),
-            fixture["epoch"],
-            fixture["horizon"],
-        )
+        bm = _build_bitmap(fixture_id)
 
         record = allocate(
             bm,
@@ -159,9 +166,7 @@ class TestResourceVariety:
         ids=lambda t: t["id"],
     )
     def test_working_minutes(self, tc):
-        fixture = _CONTRACTS["resource_variety"]
-        res_cfg = fixture["resources"][tc["resource_id"]]
-        cal = _build_calendar(res_cfg["rules"], res_cfg.get("exceptions", {}))
+        cal = _build_calendar("resource_variety", tc["resource_id"])
 
         start = datetime.fromisoformat(tc["start"])
         end = datetime.fromisoformat(tc["end"])
@@ -176,14 +181,7 @@ class TestResourceVariety:
     def test_allocation(self, tc):
         from scheduling_primitives.occupancy import allocate
 
-        fixture = _CONTRACTS["resource_variety"]
-        res_cfg = fixture["resources"][tc["resource_id"]]
-        bm = _build_bitmap(
-            res_cfg["rules"],
-            res_cfg.get("exceptions", {}),
-            fixture["epoch"],
-            fixture["horizon"],
-        )
+        bm = _build_bitmap("resource_variety", tc["resource_id"])
 
         record = allocate(
             bm,
@@ -214,13 +212,8 @@ class TestStress:
 
         # Build resource bitmaps
         bitmaps = {}
-        for rid, res_cfg in fixture["resources"].items():
-            bitmaps[rid] = _build_bitmap(
-                res_cfg["rules"],
-                res_cfg.get("exceptions", {}),
-                fixture["epoch"],
-                fixture["horizon"],
-            )
+        for rid in fixture["resources"]:
+            bitmaps[rid] = _build_bitmap("stress", rid)
 
         # Schedule all operations
         results = []
@@ -243,15 +236,15 @@ class TestStress:
             by_resource.setdefault(tc["resource_id"], []).append(record)
 
         for rid, allocs in by_resource.items():
-            occupied: set[int] = set()
-            for alloc in allocs:
-                for begin, end in alloc.spans:
-                    for t in range(begin, end):
-                        assert t not in occupied, (
-                            f"Double-booking at offset {t} on {rid} "
-                            f"({alloc.operation_id})"
-                        )
-                        occupied.add(t)
+            spans = sorted(
+                (begin, end, alloc.operation_id)
+                for alloc in allocs for begin, end in alloc.spans
+            )
+            for (b1, e1, op1), (b2, e2, op2) in zip(spans, spans[1:]):
+                assert e1 <= b2, (
+                    f"Double-booking on {rid}: {op1} [{b1},{e1}) "
+                    f"overlaps {op2} [{b2},{e2})"
+                )
 
         # Verify work_units match
         for tc, record in zip(fixture["tests"]["allocations"], results):
@@ -0,0 +1,202 @@
+"""Tests for the interval list engine — IntervalOccupancy.
+
+Test data loaded from: data/fixtures/scenarios/walk.json, auto_extend.json
+(scenarios shared with the bitmap engine, which must give identical results).
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from conftest import load_scenarios, make_bitmap, make_intervals
+
+_walk = load_scenarios("walk")
+_extend = {s["id"]: s for s in load_scenarios("auto_extend")["auto_extend"]}
+
+
+def _free_runs(bm) -> list[tuple[int, int]]:
+    """Maximal runs of free bits in a bitmap, as absolute (begin, end) pairs."""
+    runs = []
+    i = bm.bits.find(1)
+    while i >= 0:
+        j = bm.bits.find(0, i)
+        if j < 0:
+            j = len(bm.bits)
+        runs.append((i + bm.horizon_begin, j + bm.horizon_begin))
+        i = bm.bits.find(1, j)
+    return runs
+
+
+class TestFromCalendar:
+    """Materialisation produces the bitmap's free runs as merged intervals."""
+
+    @pytest.mark.parametrize("name", [
+        "standard", "holiday", "split_shift", "overnight",
+        "overnight_consecutive", "overnight_midnight", "multi_exception",
+    ])
+    def test_matches_bitmap(self, name):
+        occ = make_intervals(name)
+        bm = make_bitmap(name)
+        assert occ.free == _free_runs(bm)
+        assert occ.horizon_begin == bm.horizon_begin
+        assert occ.horizon_end == bm.horizon_end
+
+    def test_hour_resolution(self):
+        occ = make_intervals("standard", resolution="hour")
+        assert occ.free[0] == (8, 17)
+        assert occ.free == _free_runs(make_bitmap("standard", resolution="hour"))
+
+    def test_extension_merges_run_across_old_horizon(self):
+        """A shift cut by the horizon end becomes one interval once extended."""
+        from scheduling_primitives._intervals import walk
+
+        occ = make_intervals("overnight", horizon_end="2025-01-06T23:00")
+        assert occ.free[-1] == (1320, 1380)
+        # Needs more than the 60 units left before the horizon, so walk extends
+        record = walk(occ, "OP-1", earliest_start=1320, work_units=400)
+        assert record.spans == ((1320, 1720),)
+        assert (1320, 1800) in occ.free
+
+
+class TestWalk:
+    """walk() returns the same records as the bitmap engine's walk()."""
+
+    @pytest.mark.parametrize("spec", _walk["non_splittable"], ids=lambda s: s["id"])
+    def test_non_splittable(self, spec):
+        from scheduling_primitives._intervals import walk
+
+        record = walk(make_intervals(spec["calendar"]), spec["operation_id"],
+                      earliest_start=spec["earliest_start"],
+                      work_units=spec["work_units"])
+        assert record.start == spec["expected_start"], spec["notes"]
+        assert record.spans == tuple(tuple(s) for s in spec["expected_spans"])
+
+    @pytest.mark.parametrize("spec", _walk["splittable"], ids=lambda s: s["id"])
+    def test_splittable(self, spec):
+        from scheduling_primitives._intervals import walk
+
+        record = walk(make_intervals(spec["calendar"]), spec["operation_id"],
+                      earliest_start=spec["earliest_start"],
+                      work_units=spec["work_units"], allow_split=True)
+        assert record.start == spec["expected_start"], spec["notes"]
+        assert record.finish == spec["expected_finish"], spec["notes"]
+        assert record.spans == tuple(tuple(s) for s in spec["expected_spans"])
+
+    @pytest.mark.parametrize(
+        "key,allow_split",
+        [("non_splittable_deadline", False), ("splittable_deadline", True)],
+    )
+    def test_deadline_exceeded(self, key, allow_split):
+        from scheduling_primitives._intervals import walk
+        from scheduling_primitives.types import InfeasibleError
+
+        for spec in _walk[key]:
+            occ = make_intervals(spec["calendar"],
+                                 spec.get("horizon_start"), spec.get("horizon_end"))
+            with pytest.raises(InfeasibleError) as exc_info:
+                walk(occ, spec["operation_id"],
+                     earliest_start=spec["earliest_start"],
+                     work_units=spec["work_units"],
+                     allow_split=allow_split,
+                     deadline=spec["deadline"])
+            assert exc_info.value.reason == spec["expected_error"], spec["notes"]
+
+    def test_walk_is_read_only(self):
+        from scheduling_primitives._intervals import walk
+
+        occ = make_intervals("standard")
+        before = list(occ.free)
+        walk(occ, "OP-1", earliest_start=0, work_units=700, allow_split=True)
+        assert occ.free == before
+
+    @pytest.mark.parametrize(
+        "scenario", ["run_straddles_horizon", "split_run_straddles_horizon"]
+    )
+    def test_run_straddling_horizon(self, scenario):
+        from scheduling_primitives._intervals import walk
+        from scheduling_primitives.occupancy import walk as bitmap_walk
+
+        spec = _extend[scenario]
+        kwargs = dict(earliest_start=spec["earliest_start"],
+                      work_units=spec["work_units"],
+                      allow_split=spec["allow_split"],
+                      min_split=spec.get("min_split", 1))
+        occ = make_intervals(spec["calendar"], horizon_end=spec["horizon_end"])
+        bm = make_bitmap(spec["calendar"], horizon_end=spec["horizon_end"])
+        assert walk(occ, spec["operation_id"], **kwargs) == bitmap_walk(
+            bm, spec["operation_id"], **kwargs
+        ), spec["notes"]
+
+
+class TestAllocate:
+    """allocate / deallocate / apply_dynamic_exception keep the free list exact."""
+
+    def test_allocate_then_deallocate_round_trips(self):
+        from scheduling_primitives._intervals import (
+            allocate,
+            apply_dynamic_exception,
+            deallocate,
+        )
+
+        occ = make_intervals("standard")
+        before = list(occ.free)
+        first = allocate(occ, "OP-1", earliest_start=600, work_units=120)
+        second = allocate(occ, "OP-2", earliest_start=0, work_units=700,
+                          allow_split=True)
+        assert first.spans == ((600, 720),)
+        assert second.spans == ((480, 600), (720, 1020), (1920, 2200))
+        assert (480, 600) not in occ.free
+
+        deallocate(occ, first)
+        deallocate(occ, second)
+        assert occ.free == before
+        # Nothing left to conflict with
+        assert apply_dynamic_exception(occ, 0, 2880, is_working=False) == []
+
+    def test_deallocate_outside_horizon_raises(self):
+        """A record outside the horizon is rejected, not merged into free."""
+        from scheduling_primitives._intervals import deallocate
+        from scheduling_primitives.types import AllocationRecord
+
+        occ = make_intervals("standard")
+        before = list(occ.free)
+        for spans in [((480, 540), (20000, 20060)), ((-60, 0),)]:
+            record = AllocationRecord(
+                operation_id="OP-X", resource_id=occ.resource_id,
+                start=spans[0][0], finish=spans[-1][1],
+                work_units=sum(end - begin for begin, end in spans),
+                allow_split=len(spans) > 1, spans=spans,
+            )
+            with pytest.raises(IndexError):
+                deallocate(occ, record)
+            assert occ.free == before, "no span may be applied before the error"
+
+    def test_dynamic_exception_conflicts_and_merging(self):
+        from scheduling_primitives._intervals import allocate, apply_dynamic_exception
+
+        occ = make_intervals("standard")
+        record = allocate(occ, "OP-1", earliest_start=480, work_units=60)
+
+        assert apply_dynamic_exception(occ, 500, 560, is_working=False) == [record]
+        assert apply_dynamic_exception(occ, 1000, 1100, is_working=False) == []
+        assert occ.free[0] == (560, 1000)
+
+        # Overtime joins Monday evening to Tuesday morning
+        assert apply_dynamic_exception(occ, 1000, 1920, is_working=True) == []
+        assert occ.free[0] == (560, 2460)
+
+    def test_checkpoint_restore(self):
+        from scheduling_primitives._intervals import allocate, apply_dynamic_exception
+
+        occ = make_intervals("standard", horizon_end="2025-01-08T00:00")
+        snap = occ.checkpoint()
+        free_before = list(occ.free)
+
+        allocate(occ, "OP-1", earliest_start=480, work_units=1100, allow_split=True)
+        assert occ.horizon_end > 2880
+
+        occ.restore(snap)
+        assert occ.free == free_before
+        assert occ.horizon_end == 2880
+        # The undone allocation no longer shows up as a conflict
+        assert apply_dynamic_exception(occ, 0, 2880, is_working=False) == []
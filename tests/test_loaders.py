@@ -0,0 +1,117 @@
+"""Tests for JSON calendar loaders.
+
+Test data loaded from: data/fixtures/simple.json (multi-resource files are
+written to tmp_path).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from datetime import datetime
+
+from conftest import FIXTURES_DIR
+
+
+def _rewrite_id(path, pattern_id: str, *, keep_mtime: bool) -> None:
+    """Change the calendar id in a fixture copy, optionally hiding the edit."""
+    stat = path.stat()
+    path.write_text(path.read_text().replace('"id": "simple"', f'"id": "{pattern_id}"'))
+    mtime = stat.st_mtime_ns if keep_mtime else stat.st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stat.st_atime_ns, mtime))
+
+
+class TestLoadCalendarCache:
+    """load_calendar_json reuses calendars for unchanged files."""
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        from scheduling_primitives.loaders import load_calendar_json
+
+        path = tmp_path / "cal.json"
+        shutil.copy(FIXTURES_DIR / "simple.json", path)
+        load_calendar_json(path)
+        _rewrite_id(path, "edited", keep_mtime=True)
+        assert load_calendar_json(str(path)).pattern_id == "simple"
+
+    def test_mutating_a_loaded_calendar_does_not_leak(self):
+        from scheduling_primitives.loaders import load_calendar_json
+
+        first = load_calendar_json(FIXTURES_DIR / "simple.json")
+        first.pattern_id = "renamed"
+        second = load_calendar_json(FIXTURES_DIR / "simple.json")
+        assert second is not first
+        assert second.pattern_id == "simple"
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        from scheduling_primitives.loaders import load_calendar_json
+
+        path = tmp_path / "cal.json"
+        shutil.copy(FIXTURES_DIR / "simple.json", path)
+        load_calendar_json(path)
+        _rewrite_id(path, "edited", keep_mtime=False)
+        assert load_calendar_json(path).pattern_id == "edited"
+
+    def test_cache_clear(self, tmp_path):
+        from scheduling_primitives.loaders import (
+            _clear_calendar_cache,
+            load_calendar_json,
+        )
+
+        path = tmp_path / "cal.json"
+        shutil.copy(FIXTURES_DIR / "simple.json", path)
+        load_calendar_json(path)
+        _rewrite_id(path, "edited", keep_mtime=True)
+        _clear_calendar_cache()
+        assert load_calendar_json(path).pattern_id == "edited"
+
+    def test_cache_keeps_most_recently_used(self, tmp_path):
+        """The cache holds 32 files and evicts the least recently used."""
+        from scheduling_primitives.loaders import (
+            _clear_calendar_cache,
+            load_calendar_json,
+        )
+
+        paths = []
+        for i in range(33):
+            path = tmp_path / f"cal{i}.json"
+            shutil.copy(FIXTURES_DIR / "simple.json", path)
+            paths.append(path)
+
+        _clear_calendar_cache()
+        for path in paths[:32]:
+            load_calendar_json(path)
+        load_calendar_json(paths[0])  # hit: now most recent
+        load_calendar_json(paths[32])  # evicts paths[1]
+
+        _rewrite_id(paths[0], "edited", keep_mtime=True)
+        _rewrite_id(paths[1], "edited", keep_mtime=True)
+        assert load_calendar_json(paths[0]).pattern_id == "simple"
+        assert load_calendar_json(paths[1]).pattern_id == "edited"
+
+
+class TestLoadMultiResource:
+    """load_multi_resource_json builds one calendar per resource."""
+
+    def test_shared_definition_keeps_resource_ids(self, tmp_path):
+        from scheduling_primitives.loaders import load_multi_resource_json
+
+        rules = {"0": [["08:00", "17:00"]], "1": [["22:00", "06:00"]]}
+        path = tmp_path / "resources.json"
+        path.write_text(json.dumps({"resources": {
+            "RES-A": {"rules": rules},
+            "RES-B": {"rules": rules},
+            "RES-C": {"rules": {"0": [["06:00", "14:00"]]}},
+        }}))
+
+        cals = load_multi_resource_json(path)
+        assert {rid: c.pattern_id for rid, c in cals.items()} == {
+            "RES-A": "RES-A", "RES-B": "RES-B", "RES-C": "RES-C",
+        }
+        assert cals["RES-A"] is not cals["RES-B"]
+
+        start = datetime(2025, 1, 6, 16, 0)
+        assert (cals["RES-A"].add_minutes(start, 120)
+                == cals["RES-B"].add_minutes(start, 120)
+                == datetime(2025, 1, 7, 23, 0))
+        assert cals["RES-C"].add_minutes(start, 120) == datetime(2025, 1, 13, 8, 0)
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import pytest
 
-from conftest import load_scenarios, make_bitmap
+from conftest import first_mismatch, load_scenarios, make_bitmap
 
 _data = load_scenarios("occupancy")
 
@@ -36,7 +36,5 @@ class TestFromCalendar:
         calendar_name = spec.get("calendar", "standard")
         bm = make_bitmap(calendar_name)
         expected = spec["expected_value"]
-        for i in range(spec["range_start"], spec["range_end"]):
-            assert bm.bits[i] == expected, (
-                f"bit {i}: expected {expected} — {spec['notes']}"
-            )
+        bad = first_mismatch(bm.bits, spec["range_start"], spec["range_end"], expected)
+        assert bad is None, f"bit {bad}: expected {expected} — {spec['notes']}"
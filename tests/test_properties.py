@@ -103,10 +103,10 @@ class TestAllocateDeallocateInverse:
         bits_before = bytes(bm.bits)
 
         record = allocate(bm, "OP-PROP", earliest_start=480, work_units=work_units)
-        assert bytes(bm.bits) != bits_before, "allocate should change bits"
+        assert bm.bits != bits_before, "allocate should change bits"
 
         deallocate(bm, record)
-        assert bytes(bm.bits) == bits_before, "deallocate should restore bits"
+        assert bm.bits == bits_before, "deallocate should restore bits"
 
 
 # ---------------------------------------------------------------------------
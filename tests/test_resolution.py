@@ -99,6 +99,18 @@ class TestTimeResolution:
         with pytest.raises((TypeError, ValueError)):
             res.to_int(dt, aware_epoch)
 
+    def test_rejection_not_masked_by_memo(self):
+        """Conversions are memoised; an aware twin of a cached dt still fails."""
+        res = _get_resolution("minute")
+        dt = datetime(2025, 1, 6, 8, 0)
+        assert res.to_int(dt, EPOCH) == res.to_int(dt, EPOCH) == 480
+        with pytest.raises(TypeError):
+            res.to_int(dt.replace(tzinfo=timezone.utc), EPOCH)
+        with pytest.raises(ValueError, match="align"):
+            res.to_int(dt.replace(second=30), EPOCH)
+        with pytest.raises(ValueError, match="align"):
+            res.to_int(dt.replace(second=30), EPOCH)
+
     @pytest.mark.parametrize("spec", PREDEFINED, ids=lambda s: s["id"])
     def test_predefined(self, spec):
         """Predefined resolution has correct unit_seconds and label."""
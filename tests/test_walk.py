@@ -39,7 +39,8 @@ class TestNonSplittableWalk:
         from scheduling_primitives.occupancy import walk
         from scheduling_primitives.types import InfeasibleError
 
-        bm = make_bitmap(spec["calendar"])
+        bm = make_bitmap(spec["calendar"],
+                         spec.get("horizon_start"), spec.get("horizon_end"))
         with pytest.raises(InfeasibleError) as exc_info:
             walk(bm, spec["operation_id"],
                  earliest_start=spec["earliest_start"],
@@ -58,7 +59,7 @@ class TestNonSplittableWalk:
         walk(bm, spec["operation_id"],
              earliest_start=spec["earliest_start"],
              work_units=spec["work_units"])
-        assert bytes(bm.bits) == bits_before
+        assert bm.bits == bits_before
 
 
 class TestSplittableWalk:
@@ -106,10 +107,26 @@ class TestSplittableWalk:
         from scheduling_primitives.occupancy import walk
         from scheduling_primitives.types import InfeasibleError
 
-        bm = make_bitmap(spec["calendar"])
+        bm = make_bitmap(spec["calendar"],
+                         spec.get("horizon_start"), spec.get("horizon_end"))
         with pytest.raises(InfeasibleError):
             walk(bm, spec["operation_id"],
                  earliest_start=spec["earliest_start"],
                  work_units=spec["work_units"],
                  allow_split=True,
                  deadline=spec["deadline"])
+
+    def test_splittable_deadline_shortfall(self):
+        """The infeasibility error reports the exact units that did not fit."""
+        from scheduling_primitives.occupancy import allocate, walk
+        from scheduling_primitives.types import InfeasibleError
+
+        bm = make_bitmap("standard")
+        allocate(bm, "BLOCK", earliest_start=600, work_units=60)
+
+        # Mon 08:00-17:00 less the 60-unit block leaves 480 before the deadline
+        with pytest.raises(InfeasibleError) as exc_info:
+            walk(bm, "OP-SHORT", earliest_start=0, work_units=500,
+                 allow_split=True, deadline=1020)
+        assert exc_info.value.work_units_remaining == 20
+        assert exc_info.value.reason == "deadline"